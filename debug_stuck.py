@@ -164,7 +164,7 @@ def monitor_simulation(config_path, num_steps=200, timeout_seconds=30):
             # Información adicional de debugging
             print("\nInformación de debugging:")
             print(f"  - Total agentes: {len(model.agents)}")
-            print(f"  - Egg batches: {len(model.egg_manager.egg_batches)}")
+            print(f"  - Egg batches: {model.egg_manager.num_batches}")
             print(f"  - Sitios de cría: {len(model.sitios_cria)}")
             
             return
@@ -5,7 +5,7 @@ Contiene las implementaciones de agentes humanos y mosquitos.
 """
 
 from .human_agent import HumanAgent, EstadoSalud, TipoMovilidad
-from .mosquito_agent import MosquitoAgent, EstadoMosquito, EtapaVida
+from .mosquito_agent import MosquitoAgent, EstadoMosquito, EtapaVida, ParametrosMosquito
 
 __version__ = "0.1.0"
 __all__ = [
@@ -14,5 +14,6 @@ __all__ = [
     'EstadoSalud',
     'EstadoMosquito',
     'TipoMovilidad',
-    'EtapaVida'
+    'EtapaVida',
+    'ParametrosMosquito'
 ]
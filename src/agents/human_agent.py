@@ -10,10 +10,11 @@ Universidad Industrial de Santander - Simulación Digital F1
 """
 
 from mesa import Agent
-import numpy as np
 from enum import Enum
 from typing import Tuple, Optional
 
+from ..utils.vecindad import offsets_moore
+
 
 class EstadoSalud(Enum):
     """Estados epidemiológicos del modelo SEIR."""
@@ -31,6 +32,17 @@ class TipoMovilidad(Enum):
     ESTACIONARIO = 4    # Permanece en hogar
 
 
+# OPTIMIZACIÓN: Alias de módulo de los miembros usados en el paso diario.
+# En CPython cada acceso EstadoSalud.X es una búsqueda en la metaclase de
+# Enum; comparar por identidad contra un global es ~10x más rápido. Los
+# atributos siguen guardando los miembros del Enum (API sin cambios).
+_SUSCEPTIBLE = EstadoSalud.SUSCEPTIBLE
+_EXPUESTO = EstadoSalud.EXPUESTO
+_INFECTADO = EstadoSalud.INFECTADO
+_RECUPERADO = EstadoSalud.RECUPERADO
+_ESTACIONARIO = TipoMovilidad.ESTACIONARIO
+
+
 class HumanAgent(Agent):
     """
     Agente humano con estados SEIR y movilidad diaria.
@@ -73,8 +85,27 @@ class HumanAgent(Agent):
         Probabilidad de aislamiento del agente,
     en_aislamiento : bool
         Indica si el agente está en aislamiento debido a infección
+    
+    Notes
+    -----
+    OPTIMIZACIÓN: Los atributos propios del humano se declaran en __slots__
+    (igual que en MosquitoAgent); los de mesa.Agent (unique_id, model, pos)
+    siguen en el __dict__ de la instancia.
     """
     
+    __slots__ = (
+        # Estado epidemiológico
+        'estado', 'dias_en_estado', '_aislamiento_decidido',
+        # Movilidad
+        'tipo', 'pos_hogar', 'pos_destino', 'pos_actual',
+        'prob_aislamiento', 'en_aislamiento',
+        # Métricas
+        'num_picaduras',
+        # Parámetros cacheados del modelo
+        'incubation_period', 'infectious_period', 'infected_mobility_radius',
+        'prob_home', 'prob_destination', 'prob_park', 'prob_random',
+    )
+    
     def __init__(
         self,
         unique_id: int,
@@ -94,8 +125,9 @@ class HumanAgent(Agent):
         self.pos_hogar = pos_hogar
         self.pos_destino = pos_destino  # Escuela/oficina
         self.pos_actual = pos_hogar
-        self.prob_aislamiento = getattr(model, 'isolation_probability', 0.7)  # 70% por defecto
+        self.prob_aislamiento = model.isolation_probability
         self.en_aislamiento = False
+        self._aislamiento_decidido = False
         
         # Métricas
         self.num_picaduras = 0
@@ -152,18 +184,17 @@ class HumanAgent(Agent):
         """
         self.dias_en_estado += 1
         
-        if self.estado == EstadoSalud.EXPUESTO:
+        if self.estado is _EXPUESTO:
             if self.dias_en_estado >= self.incubation_period:
-                self.estado = EstadoSalud.INFECTADO
-                self.dias_en_estado = 0
+                self._cambiar_estado(_INFECTADO)
+                self.model.indice_humanos.actualizar_infeccioso(self, True)
                 
-        elif self.estado == EstadoSalud.INFECTADO:
+        elif self.estado is _INFECTADO:
             if self.dias_en_estado >= self.infectious_period:
-                self.estado = EstadoSalud.RECUPERADO
-                self.dias_en_estado = 0
+                self._cambiar_estado(_RECUPERADO)
+                self.model.indice_humanos.actualizar_infeccioso(self, False)
                 # Resetear flag de aislamiento para futuras reinfecciones
-                if hasattr(self, '_aislamiento_decidido'):
-                    self._aislamiento_decidido = False
+                self._aislamiento_decidido = False
     
     def get_exposed(self):
         """
@@ -172,11 +203,25 @@ class HumanAgent(Agent):
         Solo aplicable si el humano está en estado Susceptible.
         La probabilidad de transmisión α = 0.6 se maneja en la interacción.
         """
-        if self.estado == EstadoSalud.SUSCEPTIBLE:
-            self.estado = EstadoSalud.EXPUESTO
-            self.dias_en_estado = 0
+        if self.estado is _SUSCEPTIBLE:
+            self._cambiar_estado(_EXPUESTO)
             self.num_picaduras += 1
     
+    def _cambiar_estado(self, nuevo: EstadoSalud):
+        """
+        Cambia el estado epidemiológico y actualiza el conteo del modelo.
+        
+        Parameters
+        ----------
+        nuevo : EstadoSalud
+            Estado al que pasa el humano
+        """
+        conteo = self.model.conteo_humanos
+        conteo[self.estado] -= 1
+        conteo[nuevo] += 1
+        self.estado = nuevo
+        self.dias_en_estado = 0
+    
     def es_infeccioso(self) -> bool:
         """
         Indica si el humano puede infectar a un mosquito.
@@ -186,7 +231,7 @@ class HumanAgent(Agent):
         bool
             True si está en estado Infectado (I), False en caso contrario
         """
-        return self.estado == EstadoSalud.INFECTADO
+        return self.estado is _INFECTADO
     
     def es_susceptible(self) -> bool:
         """
@@ -197,7 +242,7 @@ class HumanAgent(Agent):
         bool
             True si está en estado Susceptible (S), False en caso contrario
         """
-        return self.estado == EstadoSalud.SUSCEPTIBLE
+        return self.estado is _SUSCEPTIBLE
     
     def ejecutar_movilidad_diaria(self):
         """
@@ -215,17 +260,17 @@ class HumanAgent(Agent):
         """
         # OPTIMIZACIÓN: Skip para estacionarios que ya están en casa
         # Estacionarios tienen 95% prob de quedarse en casa, si ya están allí, skip
-        if (self.tipo == TipoMovilidad.ESTACIONARIO and 
+        if (self.tipo is _ESTACIONARIO and 
             self.pos == self.pos_hogar and 
-            self.estado != EstadoSalud.INFECTADO):
+            self.estado is not _INFECTADO):
             # 95% de probabilidad de quedarse, solo procesar el 5% restante
             if self.random.random() < 0.95:
                 return  # Skip movimiento
         
         # Infectados: decisión de aislamiento
-        if self.estado == EstadoSalud.INFECTADO:
+        if self.estado is _INFECTADO:
             # Decidir aislamiento al momento de infectarse (una sola vez)
-            if not hasattr(self, '_aislamiento_decidido'):
+            if not self._aislamiento_decidido:
                 self.en_aislamiento = (self.random.random() < self.prob_aislamiento)
                 self._aislamiento_decidido = True
             
@@ -240,14 +285,21 @@ class HumanAgent(Agent):
                 
                 if distancia_a_casa <= self.infected_mobility_radius:
                     # Ya está en casa o muy cerca: movilidad local reducida
-                    vecindad = self.model.grid.get_neighborhood(
-                        self.pos,  # Movilidad local desde posición actual
-                        moore=True,
-                        include_center=True,
-                        radius=self.infected_mobility_radius
-                    )
-                    nueva_pos = self.random.choice(vecindad)
-                    self.mover_a(nueva_pos)
+                    # desde la posición actual.
+                    # OPTIMIZACIÓN: se sortea un desplazamiento de la tabla
+                    # precalculada (incluye quedarse) y se rechazan los que
+                    # salen del grid, en vez de construir la vecindad con
+                    # grid.get_neighborhood en cada paso
+                    offsets = offsets_moore(self.infected_mobility_radius, True)
+                    ancho, alto = self.model.width, self.model.height
+                    x, y = self.pos
+                    while True:
+                        dx, dy = offsets[self.random.randrange(len(offsets))]
+                        nueva_x = x + dx
+                        nueva_y = y + dy
+                        if 0 <= nueva_x < ancho and 0 <= nueva_y < alto:
+                            break
+                    self.mover_a((nueva_x, nueva_y))
                 else:
                     # Está lejos de casa: ir directo a casa
                     self.mover_a(self.pos_hogar)
@@ -292,7 +344,9 @@ class HumanAgent(Agent):
             Coordenadas (x, y) de destino
         """
         if self.pos != nueva_pos:
+            pos_anterior = self.pos
             self.model.grid.move_agent(self, nueva_pos)
+            self.model.indice_humanos.mover(self, pos_anterior, nueva_pos)
             self.pos_actual = nueva_pos
     
     def _obtener_parque_cercano(self) -> Optional[Tuple[int, int]]:
@@ -304,12 +358,9 @@ class HumanAgent(Agent):
         Optional[Tuple[int, int]]
             Coordenadas del parque más cercano o None si no hay parques
         """
-        # Usar la lista de parques cacheada en el modelo (ya accesible directamente)
-        if not self.model.parques:
-            return None
-        
-        # Retornar el más cercano a la posición actual
-        return min(self.model.parques, key=lambda p: self._distancia_manhattan(p))
+        # Búsqueda memorizada por celda en el modelo (el más cercano a la
+        # posición actual; el primero de model.parques en caso de empate)
+        return self.model.obtener_parque_cercano(self.pos)
     
     def _distancia_manhattan(self, pos: Tuple[int, int]) -> int:
         """
@@ -338,9 +389,10 @@ class HumanAgent(Agent):
         Tuple[int, int]
             Coordenadas (x, y) aleatorias dentro del grid
         """
-        x = self.random.randrange(self.model.grid.width)
-        y = self.random.randrange(self.model.grid.height)
-        return (x, y)
+        # Dimensiones guardadas en el modelo (mismas que las del grid)
+        model = self.model
+        return (self.random.randrange(model.width),
+                self.random.randrange(model.height))
     
     def __repr__(self) -> str:
         """Representación en cadena del agente."""
@@ -13,23 +13,179 @@ Universidad Industrial de Santander - Simulación Digital F1
 
 from mesa import Agent
 import numpy as np
-from enum import Enum
-from typing import Tuple, Optional, List, TYPE_CHECKING
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Tuple, Optional, List, Sequence, TYPE_CHECKING
+
+from ..utils.vecindad import offsets_moore
 
 if TYPE_CHECKING:
     from .human_agent import HumanAgent
 
 
-class EstadoMosquito(Enum):
-    """Estados epidemiológicos del modelo SI (sin recuperación)."""
-    SUSCEPTIBLE = "S"
-    INFECTADO = "I"
+# Número de candidatos a partir del cual conviene calcular distancias con
+# NumPy; para listas más cortas el costo de crear el array domina
+_UMBRAL_VECTORIZACION = 64
+
+
+class EstadoMosquito(IntEnum):
+    """
+    Estados epidemiológicos del modelo SI (sin recuperación).
+    
+    OPTIMIZACIÓN: IntEnum para que las comparaciones en el paso diario sean
+    comparaciones de enteros y los valores puedan guardarse en arrays uint8.
+    """
+    SUSCEPTIBLE = 0  # S
+    INFECTADO = 1    # I
 
 
-class EtapaVida(Enum):
-    """Etapas del ciclo de vida del mosquito."""
-    HUEVO = "egg"           # Huevo en sitio de cría
-    ADULTO = "adult"        # Mosquito adulto
+class EtapaVida(IntEnum):
+    """Etapas del ciclo de vida del mosquito (códigos enteros, ver EstadoMosquito)."""
+    HUEVO = 0           # Huevo en sitio de cría
+    ADULTO = 1          # Mosquito adulto
+
+
+# Alias de módulo de los miembros usados en el paso diario (evitan la
+# búsqueda en la clase del Enum en cada comparación)
+_SUSCEPTIBLE = EstadoMosquito.SUSCEPTIBLE
+_INFECTADO = EstadoMosquito.INFECTADO
+_HUEVO = EtapaVida.HUEVO
+_ADULTO = EtapaVida.ADULTO
+
+
+def _indice_mas_cercano(candidatos: Sequence[Tuple[int, int]], x: int, y: int) -> Tuple[int, int]:
+    """
+    Índice del candidato más cercano a (x, y) y su distancia al cuadrado.
+    
+    No retorna una posición: el primer elemento indexa ``candidatos``. Se usa
+    la distancia euclidiana al cuadrado (sqrt es monótona, por lo que no
+    altera el orden). Ante empates gana el primer candidato (igual que
+    argmin). Con menos de _UMBRAL_VECTORIZACION candidatos se hace una sola
+    pasada en Python; por encima, las distancias se calculan con NumPy.
+    
+    Parameters
+    ----------
+    candidatos : Sequence[Tuple[int, int]]
+        Posiciones candidatas (no vacía)
+    x, y : int
+        Posición de referencia
+        
+    Returns
+    -------
+    idx : int
+        Índice en ``candidatos`` del candidato más cercano
+    dist_sq : int
+        Distancia euclidiana al cuadrado de ese candidato a (x, y)
+    """
+    if len(candidatos) < _UMBRAL_VECTORIZACION:
+        idx = 0
+        mejor = None
+        for i, (cx, cy) in enumerate(candidatos):
+            dist_sq = (cx - x) * (cx - x) + (cy - y) * (cy - y)
+            if mejor is None or dist_sq < mejor:
+                mejor = dist_sq
+                idx = i
+        return idx, mejor
+    
+    posiciones = np.array(candidatos, dtype=np.int32)
+    dist_sq = (posiciones[:, 0] - x) ** 2 + (posiciones[:, 1] - y) ** 2
+    idx = int(dist_sq.argmin())
+    return idx, int(dist_sq[idx])
+
+
+@dataclass(frozen=True)
+class ParametrosMosquito:
+    """
+    Parámetros de comportamiento de los mosquitos, compartidos por todos.
+    
+    El modelo crea una sola instancia al inicializarse y cada MosquitoAgent
+    guarda una referencia a ella, en lugar de copiar cada parámetro en
+    todos los agentes.
+    
+    Attributes
+    ----------
+    dias_cooldown_reproduccion : int
+        Ciclo gonotrófico: días entre puestas
+    mortality_rate : float
+        Probabilidad diaria de muerte del adulto
+    sensory_range : int
+        Rango sensorial para detectar humanos (celdas)
+    mating_probability : float
+        Probabilidad diaria de apareamiento
+    eggs_per_female : int
+        Huevos por puesta
+    immature_development_threshold : float
+        Umbral térmico del desarrollo inmaduro, T_base_inmaduro (°C)
+    immature_thermal_constant : float
+        Constante térmica del desarrollo inmaduro, K_inmaduro (°C·día)
+    mosquito_to_human_prob : float
+        Probabilidad de transmisión mosquito → humano (α)
+    human_to_mosquito_prob : float
+        Probabilidad de transmisión humano → mosquito (β)
+    rainfall_threshold : float
+        Precipitación mínima para reproducirse (mm)
+    female_ratio : float
+        Proporción de huevos hembra
+    max_range : int
+        Rango de vuelo diario (celdas)
+    max_range_sq : int
+        Rango de vuelo al cuadrado (comparación de distancias sin sqrt)
+    x_max : int
+        Última columna válida del grid (width - 1)
+    y_max : int
+        Última fila válida del grid (height - 1)
+    """
+    dias_cooldown_reproduccion: int
+    mortality_rate: float
+    sensory_range: int
+    mating_probability: float
+    eggs_per_female: int
+    immature_development_threshold: float
+    immature_thermal_constant: float
+    mosquito_to_human_prob: float
+    human_to_mosquito_prob: float
+    rainfall_threshold: float
+    female_ratio: float
+    max_range: int
+    max_range_sq: int
+    x_max: int
+    y_max: int
+    
+    @classmethod
+    def desde_modelo(cls, model) -> 'ParametrosMosquito':
+        """
+        Construye los parámetros a partir de la configuración del modelo.
+        
+        Parameters
+        ----------
+        model : DengueModel
+            Modelo con la configuración ya cargada y el grid creado
+            
+        Returns
+        -------
+        ParametrosMosquito
+            Parámetros compartidos de los mosquitos
+        """
+        return cls(
+            # Ciclo gonotrófico: días entre puestas (cargado desde configuración)
+            # Rango biológico: 2-4 días según Scott et al. (1993), Maciel-de-Freitas et al. (2006)
+            dias_cooldown_reproduccion=model.gonotrophic_cycle_days,
+            mortality_rate=model.mortality_rate,
+            sensory_range=model.sensory_range,
+            mating_probability=model.mating_probability,
+            eggs_per_female=model.eggs_per_female,
+            # Modelo de grados-día acumulados (GDD), Tun-Lin et al. (1999) [15]
+            immature_development_threshold=model.immature_development_threshold,
+            immature_thermal_constant=model.immature_thermal_constant,
+            mosquito_to_human_prob=model.mosquito_to_human_prob,
+            human_to_mosquito_prob=model.human_to_mosquito_prob,
+            rainfall_threshold=model.rainfall_threshold,
+            female_ratio=model.female_ratio,
+            max_range=model.max_range,
+            max_range_sq=model.max_range ** 2,
+            x_max=model.grid.width - 1,
+            y_max=model.grid.height - 1
+        )
 
 
 class MosquitoAgent(Agent):
@@ -77,8 +233,25 @@ class MosquitoAgent(Agent):
         Ubicación del sitio de cría (para huevos)
     rango_sensorial : int
         Distancia en celdas para detectar humanos (Sr = 3)
+    
+    Notes
+    -----
+    OPTIMIZACIÓN: Los atributos propios del mosquito se declaran en
+    __slots__ (acceso directo por descriptor y menos memoria por instancia).
+    mesa.Agent no define __slots__, por lo que los atributos de la clase base
+    (unique_id, model, pos) siguen en el __dict__ de la instancia.
     """
     
+    __slots__ = (
+        # Estado y ciclo de vida
+        'estado', 'etapa', 'dias_como_huevo', 'edad', 'grados_acumulados',
+        # Comportamiento
+        'ha_picado_hoy', 'esta_apareado', 'sitio_cria',
+        'dias_desde_ultima_puesta',
+        # Parámetros compartidos (ParametrosMosquito del modelo)
+        'params',
+    )
+    
     def __init__(
         self,
         unique_id: int,
@@ -102,34 +275,12 @@ class MosquitoAgent(Agent):
         self.sitio_cria = sitio_cria
         self.dias_desde_ultima_puesta = 0  # Control de cooldown de reproducción
         
-        # Ciclo gonotrófico: días entre puestas (cargado desde configuración)
-        # Rango biológico: 2-4 días según Scott et al. (1993), Maciel-de-Freitas et al. (2006)
-        self.dias_cooldown_reproduccion = model.gonotrophic_cycle_days
-        
-        # Parámetros desde configuración del modelo (cacheados para rendimiento)
-        self.mortality_rate = model.mortality_rate
-        self.sensory_range = model.sensory_range
-        self.mating_probability = model.mating_probability
-        self.eggs_per_female = model.eggs_per_female
-        
-        # Parámetros del modelo de grados-día acumulados (GDD) para desarrollo inmaduro
-        # Basado en Tun-Lin et al. (1999) para Aedes aegypti [15]
-        self.immature_development_threshold = model.immature_development_threshold  # T_base_inmaduro (°C)
-        self.immature_thermal_constant = model.immature_thermal_constant  # K_inmaduro (°C·día)
-        
         # Acumulador de grados-día para desarrollo inmaduro (huevo → adulto)
         self.grados_acumulados = 0.0
         
-        # Parámetros de transmisión (cacheados)
-        self.mosquito_to_human_prob = model.mosquito_to_human_prob  # α
-        self.human_to_mosquito_prob = model.human_to_mosquito_prob  # β
-        
-        # Parámetros de reproducción (cacheados)
-        self.rainfall_threshold = model.rainfall_threshold
-        self.female_ratio = model.female_ratio
-        
-        # Parámetros de movimiento (cacheados)
-        self.max_range = model.max_range
+        # Parámetros desde configuración del modelo (una sola instancia
+        # compartida por todos los mosquitos)
+        self.params = model.parametros_mosquito
     
     def step(self):
         """
@@ -139,7 +290,7 @@ class MosquitoAgent(Agent):
         - HUEVO: Verificar si eclosiona (depende de temperatura)
         - ADULTO: Moverse, buscar humanos (hembras), aparearse, reproducir
         """
-        if self.etapa == EtapaVida.HUEVO:
+        if self.etapa == _HUEVO:
             self.procesar_desarrollo_huevo()
         else:  # ADULTO
             self.procesar_comportamiento_adulto()
@@ -164,21 +315,15 @@ class MosquitoAgent(Agent):
         [15] Tun-Lin et al. (1999) - Aedes aegypti development thresholds
         [16] [17] Modelos entomológicos estándar de grados-día
         """
-        # Obtener temperatura media diaria del modelo
-        temperatura = self.model.temperatura_actual  # T_dia (tavg)
-        
-        # Calcular contribución diaria de grados-día
-        # GD_dia = max(T_dia - T_base_inmaduro, 0)
-        grados_dia = max(temperatura - self.immature_development_threshold, 0.0)
-        
-        # Acumular grados-día
-        self.grados_acumulados += grados_dia
+        # Acumular grados-día del día. El modelo los calcula una sola vez al
+        # actualizar el clima: GD_dia = max(T_dia - T_base_inmaduro, 0)
+        self.grados_acumulados += self.model.grados_dia_actual
         
         # Incrementar contador de días (para métricas)
         self.dias_como_huevo += 1
         
         # Verificar si se alcanzó la constante térmica total
-        if self.grados_acumulados >= self.immature_thermal_constant:
+        if self.grados_acumulados >= self.params.immature_thermal_constant:
             self.eclosionar()
     
     def eclosionar(self):
@@ -195,15 +340,29 @@ class MosquitoAgent(Agent):
         
         Si se modifican estas fuentes, asegurar que las coordenadas cumplan:
         0 <= x < grid.width y 0 <= y < grid.height
+        
+        Todo adulto tiene posición en el grid desde que eclosiona; los métodos
+        del comportamiento adulto dependen de esta invariante y no verifican
+        self.pos.
+        
+        Raises
+        ------
+        ValueError
+            Si el huevo no tiene sitio de cría asignado
         """
-        self.etapa = EtapaVida.ADULTO
+        if self.sitio_cria is None:
+            raise ValueError(
+                f"El huevo {self.unique_id} no tiene sitio de cría; "
+                f"no se puede colocar al adulto en el grid."
+            )
+        
+        self.etapa = _ADULTO
         self.dias_como_huevo = 0
         self.edad = 0
         self.grados_acumulados = 0.0        
         
-        # Colocar en el sitio de cría
-        if self.sitio_cria and not self.pos:
-            self.model.grid.place_agent(self, self.sitio_cria)
+        # Colocar en el sitio de cría (los huevos no están en el grid)
+        self.model.grid.place_agent(self, self.sitio_cria)
     
     def procesar_comportamiento_adulto(self):
         """
@@ -220,15 +379,16 @@ class MosquitoAgent(Agent):
         self.ha_picado_hoy = False
         
         # Incrementar cooldown de reproducción
-        if self.dias_desde_ultima_puesta < self.dias_cooldown_reproduccion:
+        if self.dias_desde_ultima_puesta < self.params.dias_cooldown_reproduccion:
             self.dias_desde_ultima_puesta += 1
         
         # 1. Mortalidad diaria (usar parámetro del modelo)
-        if self.random.random() < self.mortality_rate:
-            # Solo remover del grid si tiene posición
-            if self.pos is not None:
-                self.model.grid.remove_agent(self)
-            self.model.agents.remove(self)
+        if self.random.random() < self.params.mortality_rate:
+            self.model.grid.remove_agent(self)
+            # Agent.remove() elimina el registro del modelo en O(1);
+            # model.agents construye un AgentSet nuevo en cada acceso, por lo
+            # que remover de él no desregistra al agente
+            self.remove()
             return
         
         # 2. Movimiento
@@ -256,10 +416,6 @@ class MosquitoAgent(Agent):
         
         Nota: Todos los mosquitos en el modelo son hembras (los machos son implícitos).
         """
-        # Verificar que el mosquito tenga posición (huevos no tienen posición)
-        if self.pos is None:
-            return
-        
         # Buscar humano cercano
         humano_cercano = self.buscar_humano_cercano()
         if humano_cercano:
@@ -271,15 +427,30 @@ class MosquitoAgent(Agent):
         self.mover_aleatorio()
     
     def mover_aleatorio(self):
-        """Movimiento aleatorio dentro del rango de vuelo diario (Fr)."""
-        vecindad = self.model.grid.get_neighborhood(
-            self.pos,
-            moore=True,
-            include_center=False,
-            radius=self.max_range  # Rango de vuelo del mosquito (por defecto 5 celdas ~190m)
-        )
-        nueva_pos = self.random.choice(vecindad)
-        self.model.grid.move_agent(self, nueva_pos)
+        """
+        Movimiento aleatorio dentro del rango de vuelo diario (Fr).
+        
+        OPTIMIZACIÓN: En lugar de construir la lista del vecindario con
+        grid.get_neighborhood en cada movimiento, se sortea un desplazamiento
+        de la tabla precalculada del radio. Los destinos fuera del grid se
+        rechazan y se vuelve a sortear, de modo que el destino es uniforme
+        sobre las celdas válidas del vecindario (igual que get_neighborhood).
+        """
+        params = self.params
+        
+        # Rango de vuelo del mosquito (por defecto 5 celdas ~190m)
+        offsets = offsets_moore(params.max_range)
+        x_max, y_max = params.x_max, params.y_max
+        x, y = self.pos
+        
+        while True:
+            dx, dy = offsets[self.random.randrange(len(offsets))]
+            nueva_x = x + dx
+            nueva_y = y + dy
+            if 0 <= nueva_x <= x_max and 0 <= nueva_y <= y_max:
+                break
+        
+        self.model.grid.move_agent(self, (nueva_x, nueva_y))
     
     def mover_hacia(self, destino: Tuple[int, int]):
         """
@@ -293,19 +464,15 @@ class MosquitoAgent(Agent):
         x_actual, y_actual = self.pos
         x_dest, y_dest = destino
         
-        # Calcular dirección (un paso)
-        dx = np.sign(x_dest - x_actual)
-        dy = np.sign(y_dest - y_actual)
-        
-        # Nueva posición (máximo un paso)
-        nueva_x = x_actual + dx
-        nueva_y = y_actual + dy
-        
-        # Asegurar límites del grid
-        nueva_x = max(0, min(nueva_x, self.model.grid.width - 1))
-        nueva_y = max(0, min(nueva_y, self.model.grid.height - 1))
+        # Calcular dirección (un paso): signo como resta de comparaciones,
+        # sin llamar a np.sign sobre enteros de Python
+        dx = (x_dest > x_actual) - (x_dest < x_actual)
+        dy = (y_dest > y_actual) - (y_dest < y_actual)
         
-        self.model.grid.move_agent(self, (nueva_x, nueva_y))
+        # Nueva posición (máximo un paso). Cada coordenada queda entre la
+        # actual y la del destino, ambas dentro del grid, así que no hace
+        # falta recortar a los límites
+        self.model.grid.move_agent(self, (x_actual + dx, y_actual + dy))
     
     def buscar_humano_cercano(self) -> Optional['HumanAgent']:
         """
@@ -316,26 +483,21 @@ class MosquitoAgent(Agent):
         Optional[HumanAgent]
             El humano más cercano si existe, None en caso contrario
         """
-        # Verificar que el mosquito tenga posición
-        if self.pos is None:
-            return None
-        
-        # Obtener vecinos dentro del rango sensorial
-        vecinos = self.model.grid.get_neighbors(
+        # Humanos dentro del rango sensorial (índice espacial del modelo:
+        # solo revisa sectores cercanos y no requiere filtrar por tipo)
+        humanos = self.model.obtener_humanos_cercanos(
             self.pos,
-            moore=True,
-            include_center=False,
-            radius=self.sensory_range
+            self.params.sensory_range,
+            incluir_centro=False
         )
         
-        # Filtrar solo humanos (isinstance es más rápido que __class__.__name__)
-        from .human_agent import HumanAgent
-        humanos = [agente for agente in vecinos if isinstance(agente, HumanAgent)]
+        if not humanos:
+            return None
         
-        if humanos:
-            # Retornar el más cercano
-            return min(humanos, key=lambda h: self._distancia(h.pos))
-        return None
+        # Retornar el más cercano (ver _indice_mas_cercano)
+        x, y = self.pos
+        idx, _ = _indice_mas_cercano([h.pos for h in humanos], x, y)
+        return humanos[idx]
     
     def intentar_picar(self):
         """
@@ -352,14 +514,9 @@ class MosquitoAgent(Agent):
         if self.ha_picado_hoy:
             return
         
-        # Verificar que el mosquito tenga posición
-        if self.pos is None:
-            return
-        
-        # Obtener agentes en la misma celda
-        agentes_celda = self.model.grid.get_cell_list_contents([self.pos])
-        from .human_agent import HumanAgent
-        humanos = [a for a in agentes_celda if isinstance(a, HumanAgent)]
+        # Humanos en la misma celda (índice por celda del modelo: no requiere
+        # recorrer el contenido de la celda ni filtrar por tipo)
+        humanos = self.model.indice_humanos.en_celda(self.pos)
         
         if not humanos:
             return
@@ -369,18 +526,18 @@ class MosquitoAgent(Agent):
         self.ha_picado_hoy = True
         
         # Usar probabilidades de transmisión cacheadas
-        alpha = self.mosquito_to_human_prob  # α
-        beta = self.human_to_mosquito_prob  # β
+        alpha = self.params.mosquito_to_human_prob  # α
+        beta = self.params.human_to_mosquito_prob  # β
         
         # Transmisión mosquito → humano (α)
-        if self.estado == EstadoMosquito.INFECTADO and humano.es_susceptible():
+        if self.estado == _INFECTADO and humano.es_susceptible():
             if self.random.random() < alpha:
                 humano.get_exposed()
         
         # Transmisión humano → mosquito (β)
-        elif self.estado == EstadoMosquito.SUSCEPTIBLE and humano.es_infeccioso():
+        elif self.estado == _SUSCEPTIBLE and humano.es_infeccioso():
             if self.random.random() < beta:
-                self.estado = EstadoMosquito.INFECTADO
+                self.estado = _INFECTADO
     
     def intentar_apareamiento(self):
         """
@@ -399,7 +556,7 @@ class MosquitoAgent(Agent):
         - Modelar machos consume ~50% de recursos sin aportar información
         - Esta simplificación mantiene la misma dinámica poblacional
         """
-        if self.random.random() < self.mating_probability:
+        if self.random.random() < self.params.mating_probability:
             self.esta_apareado = True
     
     def intentar_reproduccion(self):
@@ -419,13 +576,12 @@ class MosquitoAgent(Agent):
         OPTIMIZACIÓN: Usa EggManager en vez de crear agentes individuales.
         """
         # Verificar cooldown (ciclo gonotrófico: tiempo entre puestas)
-        if self.dias_desde_ultima_puesta < self.dias_cooldown_reproduccion:
+        if self.dias_desde_ultima_puesta < self.params.dias_cooldown_reproduccion:
             return
         
-        # Verificar precipitación (necesaria para sitios de cría activos)
-        precipitacion = self.model.precipitacion_actual if hasattr(self.model, 'precipitacion_actual') else 0
-        
-        if precipitacion < self.rainfall_threshold:
+        # Verificar precipitación (necesaria para sitios de cría activos;
+        # DengueModel la inicializa en __init__ y la actualiza cada día)
+        if self.model.precipitacion_actual < self.params.rainfall_threshold:
             return
         
         # Buscar sitio de cría cercano
@@ -435,7 +591,7 @@ class MosquitoAgent(Agent):
         
         # Calcular número de huevos hembra (optimización: solo modelamos hembras)
         # female_ratio determina cuántos huevos son hembras
-        num_huevos_hembra = int(self.eggs_per_female * self.female_ratio)
+        num_huevos_hembra = int(self.params.eggs_per_female * self.params.female_ratio)
         
         # OPTIMIZACIÓN: Usar EggManager en vez de crear agentes individuales
         # Esto reduce drásticamente el overhead de memoria y CPU
@@ -458,59 +614,29 @@ class MosquitoAgent(Agent):
         Optional[Tuple[int, int]]
             Coordenadas del sitio de cría más cercano o None
         """
-        if self.pos is None:
+        # Sin sitios permanentes ni temporales no hay nada que buscar
+        # (evita recorrer los sectores del índice en ese caso)
+        if not self.model.sitios_cria and not self.model.sitios_cria_temporales:
             return None
         
         # Obtener sitios cercanos usando el índice espacial del modelo
-        sitios_candidatos = self.model.obtener_sitios_cercanos(self.pos, self.max_range)
+        sitios_candidatos = self.model.obtener_sitios_cercanos(self.pos, self.params.max_range)
         
         if not sitios_candidatos:
             return None
         
-        # Buscar el sitio más cercano dentro del rango
+        # Buscar el sitio más cercano (distancias al cuadrado, por lo que el
+        # rango se compara como max_range²)
         x, y = self.pos
-        max_range_sq = self.max_range ** 2  # Comparar distancias al cuadrado (evita sqrt)
-        
-        mejor_sitio = None
-        mejor_dist_sq = float('inf')
-        
-        for sitio in sitios_candidatos:
-            sx, sy = sitio
-            
-            # Calcular distancia euclidiana al cuadrado
-            dist_sq = (sx - x) ** 2 + (sy - y) ** 2
-            
-            # Verificar si está dentro del rango y es más cercano
-            if dist_sq <= max_range_sq and dist_sq < mejor_dist_sq:
-                mejor_dist_sq = dist_sq
-                mejor_sitio = sitio
+        idx, mejor = _indice_mas_cercano(sitios_candidatos, x, y)
         
-        return mejor_sitio
-    
-    def _distancia(self, pos: Tuple[int, int]) -> float:
-        """
-        Calcula distancia euclidiana a una posición.
-        
-        NOTA: Este método asume que self.pos no es None (solo adultos llaman).
-        Los huevos/larvas/pupas tienen self.pos=None, pero están protegidos por
-        validaciones en mover(), buscar_humano_cercano() y _buscar_sitio_cria()
-        que verifican self.pos antes de llamar este método.
+        # El más cercano; si está fuera de rango, ninguno lo está
+        if mejor > self.params.max_range_sq:
+            return None
         
-        Parameters
-        ----------
-        pos : Tuple[int, int]
-            Posición destino
-            
-        Returns
-        -------
-        float
-            Distancia euclidiana
-        """
-        x1, y1 = self.pos
-        x2, y2 = pos
-        return np.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        return sitios_candidatos[idx]
     
     def __repr__(self) -> str:
         """Representación en cadena del agente."""
-        return (f"MosquitoAgent(id={self.unique_id}, estado={self.estado.value}, "
-                f"etapa={self.etapa.value}, pos={self.pos})")
+        return (f"MosquitoAgent(id={self.unique_id}, estado={self.estado.name}, "
+                f"etapa={self.etapa.name}, pos={self.pos})")
@@ -66,8 +66,15 @@ class Celda:
     >>> celda_agua = Celda(TipoCelda.AGUA, (5, 5))
     >>> celda_agua.es_criadero
     True
+    
+    Notes
+    -----
+    OPTIMIZACIÓN: Atributos en __slots__ (igual que los agentes); el modelo
+    crea una Celda por cada celda del grid.
     """
     
+    __slots__ = ('tipo', 'pos', 'es_criadero')
+    
     def __init__(self, tipo: TipoCelda, pos: Tuple[int, int]):
         self.tipo = tipo
         self.pos = pos
@@ -15,16 +15,38 @@ from mesa import Model
 from mesa.space import MultiGrid
 from mesa.datacollection import DataCollector
 import numpy as np
+import gc
+import json
+import os
+import time
+from contextlib import contextmanager
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 
 from ..agents import (
-    HumanAgent, MosquitoAgent,
-    EstadoSalud, EstadoMosquito, TipoMovilidad, EtapaVida
+    HumanAgent,
+    EstadoSalud, EstadoMosquito, TipoMovilidad,
+    ParametrosMosquito
 )
 from .celda import Celda, TipoCelda
 from ..utils.climate_data import ClimateDataLoader
 from .egg_manager import EggManager
+from .mosquito_population import MosquitoPopulationGrid, MosquitoState
+from .indice_espacial import IndiceEspacialHumanos
+
+
+@contextmanager
+def _gc_pausado():
+    """Desactiva el recolector de basura cíclico dentro del bloque."""
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
 
 
 class DengueModel(Model):
@@ -63,6 +85,9 @@ class DengueModel(Model):
         Ruta al archivo CSV con datos climáticos históricos
     seed : Optional[int], default=None
         Semilla para reproducibilidad
+    recolectar_agentes : bool, default=False
+        Registrar estado, tipo y posición de cada humano en cada paso
+        (agent_reporters del DataCollector)
         
     Attributes
     ----------
@@ -74,6 +99,14 @@ class DengueModel(Model):
         Recolector de métricas por paso
     temperatura_actual : float
         Temperatura diaria en °C
+    grados_dia_actual : float
+        Grados-día de desarrollo inmaduro del día (GD_dia)
+    rng_np : np.random.Generator
+        Generador NumPy del modelo (sembrado con seed)
+    humanos : List[HumanAgent]
+        Humanos del modelo en orden de creación (los agentes del paso diario)
+    conteo_humanos : Dict[EstadoSalud, int]
+        Número de humanos en cada estado SEIR (mantenido por los agentes)
     precipitacion_actual : float
         Precipitación diaria en mm
     fecha_actual : datetime
@@ -99,7 +132,8 @@ class DengueModel(Model):
         climate_data_path: Optional[str] = None,
         seed: Optional[int] = None,
         config: Optional[Dict[str, Any]] = None,
-        config_file: Optional[str] = None
+        config_file: Optional[str] = None,
+        recolectar_agentes: bool = False
     ):
         super().__init__()
         
@@ -128,9 +162,18 @@ class DengueModel(Model):
             self.random.seed(seed)
             np.random.seed(seed)
         
+        # Generador NumPy propio del modelo para sorteos vectorizados que no
+        # deben depender del estado global de np.random (p. ej. mortalidad
+        # de huevos en EggManager)
+        self.rng_np = np.random.default_rng(seed)
+        
         # Grid espacial (múltiples agentes por celda, sin toroide)
         self.grid = MultiGrid(width, height, torus=False)
         
+        # Parámetros compartidos por todos los MosquitoAgent (requiere la
+        # configuración cargada y el grid creado)
+        self.parametros_mosquito = ParametrosMosquito.desde_modelo(self)
+        
         # Activación aleatoria de agentes (Mesa 2.3.4: self.agents.shuffle().do())
         # El contador de steps se maneja manualmente para compatibilidad con batch_run
         self.steps = 0
@@ -141,6 +184,7 @@ class DengueModel(Model):
         self.dia_simulacion = 0
         self.temperatura_actual = 25.0  # °C (valor inicial)
         self.precipitacion_actual = 0.0  # mm (valor inicial)
+        self._actualizar_grados_dia()
         
         # Cargar datos climáticos desde CSV (OBLIGATORIO)
         if not climate_data_path:
@@ -187,13 +231,23 @@ class DengueModel(Model):
         self.sitios_cria = self._generar_sitios_cria()
         
         # Índice espacial para búsqueda rápida de sitios de cría
-        # Divide el grid en sectores de tamaño sector_size x sector_size
-        self.sector_size = 10  # Cada sector es 10x10 celdas
+        # Divide el grid en sectores de tamaño sector_size x sector_size.
+        # Con sectores del tamaño del rango de vuelo, una búsqueda revisa
+        # como máximo 3x3 sectores.
+        self.sector_size = max(1, self.max_range)
         self.indice_sitios = self._crear_indice_espacial_sitios()
         
+        # Índice espacial de sitios temporales (mismos sectores), mantenido
+        # al crear y secar charcos en _actualizar_sitios_cria_temporales
+        self.indice_sitios_temporales: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        
         # Cache de parques para búsqueda rápida (evita iterar sobre todas las celdas)
         self.parques = self._generar_lista_parques()
         
+        # Parque más cercano por posición de origen, calculado la primera vez
+        # que se consulta (los parques no cambian durante la simulación)
+        self._parque_cercano: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
+        
         # Cache de celdas urbanas para asignación eficiente de hogares/destinos
         self.celdas_urbanas = self._generar_lista_urbanas()
         
@@ -204,9 +258,21 @@ class DengueModel(Model):
         self.egg_manager = EggManager(self)
         
         # Grid de poblaciones de mosquitos (modelo metapoblacional)
-        from .mosquito_population import MosquitoPopulationGrid
         self.mosquito_pop = MosquitoPopulationGrid(self.width, self.height)
         
+        # Índice espacial de humanos (sectores de lado = rango sensorial)
+        # Evita recorrer el vecindario Moore del MultiGrid y filtrar por tipo
+        self.indice_humanos = IndiceEspacialHumanos(self.sensory_range)
+        
+        # Conteo de humanos por estado SEIR. OPTIMIZACIÓN: se actualiza en
+        # cada transición (HumanAgent._cambiar_estado), así los reporteros
+        # del DataCollector no recorren todos los agentes en cada paso
+        self.conteo_humanos: Dict[EstadoSalud, int] = {estado: 0 for estado in EstadoSalud}
+        
+        # Lista fija de humanos (nunca se eliminan): el paso diario la baraja
+        # directamente en lugar de reconstruir model.agents cada día
+        self.humanos: List[HumanAgent] = []
+        
         # Crear agentes (solo humanos - mosquitos van al grid)
         self._crear_humanos(num_humanos, self.infectados_iniciales)
         self._crear_mosquitos(num_mosquitos, self.mosquitos_infectados_iniciales)
@@ -247,11 +313,16 @@ class DengueModel(Model):
                 "LSM_Activo": lambda m: m.lsm_activo,
                 "ITN_IRS_Activo": lambda m: m.itn_irs_activo,
             },
+            # OPTIMIZACIÓN: Los reporteros por agente solo se activan a
+            # petición; de lo contrario Mesa recorre todos los agentes y
+            # guarda una fila por humano en cada paso (memoria O(N·T))
             agent_reporters={
                 "Estado": "estado",
-                "Tipo": lambda a: a.tipo if hasattr(a, 'tipo') else None,
+                # Cadena de atributo: Mesa usa getattr(agente, 'tipo', None),
+                # el mismo resultado que hasattr + acceso en una sola llamada
+                "Tipo": "tipo",
                 "Posicion": "pos"
-            }
+            } if recolectar_agentes else None
         )
         
         # Recolectar estado inicial
@@ -273,8 +344,6 @@ class DengueModel(Model):
         Dict[str, Any]
             Diccionario con la configuración cargada
         """
-        import os
-        import json
         try:
             ext = os.path.splitext(ruta)[1].lower()
             with open(ruta, 'r', encoding='utf-8') as f:
@@ -472,10 +541,13 @@ class DengueModel(Model):
         # Parámetros de enfermedad mosquito (SI)
         self.mortality_rate = 0.05  # Mr = 0.05 por día
         self.sensory_range = 3  # Sr = 3 celdas
+        self.mosquito_incubation_period = 10  # EIP (días)
+        self.carrying_capacity_per_cell = 3000  # Máximo mosquitos por celda
         
         # Parámetros de transmisión
         self.mosquito_to_human_prob = 0.6  # α = 0.6
         self.human_to_mosquito_prob = 0.275  # β = 0.275
+        self.bite_rate = 0.33  # Probabilidad de picadura diaria
         
         # Parámetros de movilidad humana (probabilidades diarias por tipo)
         # Estudiantes (Tipo 1)
@@ -606,23 +678,31 @@ class DengueModel(Model):
         verbose = (self.dia_simulacion % 10 == 0)
         
         if verbose:
-            print(f"\n[STEP] Activando {len(self.agents)} agentes humanos...", flush=True)
-            import time
+            print(f"\n[STEP] Activando {len(self.humanos)} agentes humanos...", flush=True)
             start_time = time.time()
             
             # Contar mosquitos en grid
             mosquitos_total = self.mosquito_pop.total_mosquitos()
             mosquitos_infectados = self.mosquito_pop.total_infectious()
-            print(f"   Humanos: {len(self.agents)}, Mosquitos (grid): {mosquitos_total} (I:{mosquitos_infectados})", flush=True)
+            print(f"   Humanos: {len(self.humanos)}, Mosquitos (grid): {mosquitos_total} (I:{mosquitos_infectados})", flush=True)
         
-        agentes_lista = list(self.agents)
+        # OPTIMIZACIÓN: copia de la lista de humanos en orden de creación (el
+        # mismo orden que model.agents, así el barajado no cambia) sin pasar
+        # por el AgentSet que Mesa construye en cada acceso a model.agents
+        agentes_lista = self.humanos.copy()
         self.random.shuffle(agentes_lista)
         
-        for idx, agente in enumerate(agentes_lista):
-            if verbose and idx % 500 == 0:
-                elapsed = time.time() - start_time
-                print(f"   Procesando agente {idx}/{len(agentes_lista)} ({idx/len(agentes_lista)*100:.1f}%) - {elapsed:.2f}s", flush=True)
-            agente.step()
+        # OPTIMIZACIÓN: El reporte de progreso (time.time + print) solo se
+        # evalúa en los días verbose; el resto usa un bucle sin chequeos
+        if verbose:
+            for idx, agente in enumerate(agentes_lista):
+                if idx % 500 == 0:
+                    elapsed = time.time() - start_time
+                    print(f"   Procesando agente {idx}/{len(agentes_lista)} ({idx/len(agentes_lista)*100:.1f}%) - {elapsed:.2f}s", flush=True)
+                agente.step()
+        else:
+            for agente in agentes_lista:
+                agente.step()
         
         if verbose:
             elapsed = time.time() - start_time
@@ -661,6 +741,23 @@ class DengueModel(Model):
                 f"No hay datos climáticos disponibles para la fecha {self.fecha_actual.date()}. "
                 f"Verifique que la fecha esté dentro del rango del archivo CSV."
             )
+        
+        self._actualizar_grados_dia()
+    
+    def _actualizar_grados_dia(self):
+        """
+        Calcula los grados-día de desarrollo inmaduro del día actual.
+        
+        GD_dia = max(T_dia - T_base_inmaduro, 0)
+        
+        OPTIMIZACIÓN: La temperatura es un escalar diario, por lo que el
+        valor se calcula una sola vez al actualizar el clima y lo comparten
+        el EggManager y todos los huevos, en vez de recalcularlo por lote
+        o por huevo.
+        """
+        self.grados_dia_actual = max(
+            self.temperatura_actual - self.immature_development_threshold, 0.0
+        )
     
     def _actualizar_sitios_cria_temporales(self):
         """
@@ -691,6 +788,9 @@ class DengueModel(Model):
                 pos = (self.random.randrange(self.width),
                       self.random.randrange(self.height))
                 # Reiniciar duración si el sitio ya existe (lluvia renueva charco)
+                if pos not in self.sitios_cria_temporales:
+                    sector = (pos[0] // self.sector_size, pos[1] // self.sector_size)
+                    self.indice_sitios_temporales.setdefault(sector, []).append(pos)
                 self.sitios_cria_temporales[pos] = self.temp_site_duration_days
         
         # 2. Decrementar días restantes y eliminar charcos secos
@@ -705,6 +805,13 @@ class DengueModel(Model):
         # 3. Eliminar charcos secos
         for pos in sitios_a_eliminar:
             del self.sitios_cria_temporales[pos]
+            sector = (pos[0] // self.sector_size, pos[1] // self.sector_size)
+            sitios_sector = self.indice_sitios_temporales[sector]
+            sitios_sector.remove(pos)
+            # Quitar sectores vacíos para que el índice solo contenga sectores
+            # con charcos (y el dict quede vacío cuando se secan todos)
+            if not sitios_sector:
+                del self.indice_sitios_temporales[sector]
     
     def _aplicar_control(self):
         """
@@ -770,8 +877,6 @@ class DengueModel(Model):
         Dict[Tuple[int, int], Celda]
             Diccionario mapeando coordenadas a objetos Celda
         """
-        from .celda import Celda, TipoCelda
-        
         mapa = {}
         
         # Inicializar todo como urbano
@@ -780,8 +885,8 @@ class DengueModel(Model):
                 mapa[(x, y)] = Celda(TipoCelda.URBANA, (x, y))
         
         # Obtener proporciones desde configuración
-        prop_agua = getattr(self, 'water_ratio', 0.05)
-        prop_parques = getattr(self, 'park_ratio', 0.10)
+        prop_agua = self.water_ratio
+        prop_parques = self.park_ratio
         
         # Calcular cantidades totales
         total_celdas = self.width * self.height
@@ -789,7 +894,7 @@ class DengueModel(Model):
         num_parques = int(total_celdas * prop_parques)
         
         # Crear zonas de agua (clusters)
-        celdas_ocupadas = set()
+        celdas_ocupadas = np.zeros((self.width, self.height), dtype=bool)
         self._crear_zonas_tipo(mapa, TipoCelda.AGUA, num_agua, celdas_ocupadas)
         
         # Crear zonas de parques (clusters)
@@ -802,14 +907,18 @@ class DengueModel(Model):
         mapa: Dict[Tuple[int, int], 'Celda'],
         tipo: 'TipoCelda',
         num_celdas_objetivo: int,
-        celdas_ocupadas: set
+        celdas_ocupadas: np.ndarray
     ):
         """
         Crea zonas contiguas de un tipo específico.
         Versión optimizada con límites adaptativos.
-        """
-        from .celda import Celda
         
+        OPTIMIZACIÓN: La ocupación se guarda en una máscara booleana
+        (width × height), de modo que comprobar si una zona candidata está
+        libre es un .any() sobre un corte del array en lugar de probar cada
+        celda contra un set; la lista de celdas solo se genera para las
+        zonas aceptadas.
+        """
         celdas_asignadas = 0
         
         # Cachear tamaños fuera del loop
@@ -852,22 +961,20 @@ class DengueModel(Model):
             centro_x = self.random.randint(1, max_x)
             centro_y = self.random.randint(1, max_y)
             
-            # Generar lista de celdas
-            celdas_zona = [
-                (centro_x + dx, centro_y + dy)
-                for dx in range(ancho)
-                for dy in range(alto)
-            ]
-            
             # Validación rápida: si alguna está ocupada, rechazar
-            if any(pos in celdas_ocupadas for pos in celdas_zona):
+            if celdas_ocupadas[centro_x:centro_x + ancho, centro_y:centro_y + alto].any():
                 intentos_consecutivos_fallidos += 1
                 continue
             
             # Zona válida: asignar todas las celdas
+            celdas_zona = [
+                (centro_x + dx, centro_y + dy)
+                for dx in range(ancho)
+                for dy in range(alto)
+            ]
             for pos in celdas_zona:
                 mapa[pos] = Celda(tipo, pos)
-                celdas_ocupadas.add(pos)
+                celdas_ocupadas[pos] = True
                 celdas_asignadas += 1
                 
                 if celdas_asignadas >= num_celdas_objetivo:
@@ -930,8 +1037,11 @@ class DengueModel(Model):
         """
         Obtiene sitios de cría cercanos usando el índice espacial.
         
-        Solo busca en los sectores que podrían contener sitios dentro del rango.
-        Esto reduce drásticamente el número de comparaciones de distancia.
+        Solo busca en los sectores que podrían contener sitios dentro del rango,
+        tanto para sitios permanentes como temporales. Esto reduce
+        drásticamente el número de comparaciones de distancia. Los sectores
+        incluidos pueden contener sitios algo más allá del rango: quien llama
+        compara la distancia de cada candidato con max_range.
         
         Parameters
         ----------
@@ -943,32 +1053,103 @@ class DengueModel(Model):
         Returns
         -------
         List[Tuple[int, int]]
-            Lista de sitios de cría dentro del rango (permanentes + temporales)
+            Sitios de cría candidatos (permanentes + temporales)
         """
         x, y = posicion
-        
-        # Calcular sectores a revisar (sector actual + vecinos alcanzables)
-        sector_x = x // self.sector_size
-        sector_y = y // self.sector_size
-        
-        # Número de sectores a revisar en cada dirección
-        # (max_range podría cruzar múltiples sectores)
-        sectores_radio = (max_range // self.sector_size) + 1
+        s = self.sector_size
+        max_range_sq = max_range * max_range
+        
+        # Sectores que intersectan el cuadrado [x ± max_range] × [y ± max_range]
+        # OPTIMIZACIÓN: se descartan además los sectores cuyo punto más
+        # cercano a la posición está a más de max_range (distancia euclidiana,
+        # típicamente las esquinas del cuadrado): ninguno de sus sitios puede
+        # quedar dentro del rango de vuelo
+        sectores = []
+        for sector_x in range((x - max_range) // s, (x + max_range) // s + 1):
+            dx = max(sector_x * s - x, 0, x - (sector_x * s + s - 1))
+            for sector_y in range((y - max_range) // s, (y + max_range) // s + 1):
+                dy = max(sector_y * s - y, 0, y - (sector_y * s + s - 1))
+                if dx * dx + dy * dy <= max_range_sq:
+                    sectores.append((sector_x, sector_y))
         
         sitios_candidatos = []
         
         # Revisar solo sectores relevantes
-        for dx in range(-sectores_radio, sectores_radio + 1):
-            for dy in range(-sectores_radio, sectores_radio + 1):
-                sector = (sector_x + dx, sector_y + dy)
-                if sector in self.indice_sitios:
-                    sitios_candidatos.extend(self.indice_sitios[sector])
-        
-        # Incluir sitios temporales (charcos post-lluvia)
-        sitios_candidatos.extend(self.sitios_cria_temporales.keys())
+        for sector in sectores:
+            sitios = self.indice_sitios.get(sector)
+            if sitios:
+                sitios_candidatos.extend(sitios)
+        
+        # Incluir sitios temporales cercanos (charcos post-lluvia)
+        if self.indice_sitios_temporales:
+            for sector in sectores:
+                sitios = self.indice_sitios_temporales.get(sector)
+                if sitios:
+                    sitios_candidatos.extend(sitios)
         
         return sitios_candidatos
     
+    def obtener_humanos_cercanos(self, posicion: Tuple[int, int], radio: int,
+                                 incluir_centro: bool = True) -> List[HumanAgent]:
+        """
+        Obtiene humanos dentro del vecindario Moore usando el índice espacial.
+        
+        Reemplaza grid.get_neighbors + filtrado por isinstance: solo revisa
+        los sectores que intersectan el vecindario y solo itera sobre humanos.
+        
+        Parameters
+        ----------
+        posicion : Tuple[int, int]
+            Posición desde donde buscar
+        radio : int
+            Radio del vecindario Moore (celdas)
+        incluir_centro : bool, default=True
+            Si False, excluye a los humanos de la celda central
+            
+        Returns
+        -------
+        List[HumanAgent]
+            Humanos dentro del vecindario
+        """
+        return self.indice_humanos.consultar(posicion, radio, incluir_centro)
+    
+    def obtener_parque_cercano(self, posicion: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Obtiene el parque más cercano (distancia Manhattan) a una posición.
+        
+        Ante empates gana el primero de self.parques. OPTIMIZACIÓN: El
+        resultado se memoriza por posición; los humanos parten casi siempre
+        de las mismas celdas (hogar, destino, parque), así que la búsqueda
+        sobre todos los parques se hace una sola vez por celda de origen.
+        
+        Parameters
+        ----------
+        posicion : Tuple[int, int]
+            Posición desde donde buscar
+            
+        Returns
+        -------
+        Optional[Tuple[int, int]]
+            Coordenadas del parque más cercano o None si no hay parques
+        """
+        try:
+            return self._parque_cercano[posicion]
+        except KeyError:
+            pass
+        
+        x0, y0 = posicion
+        mejor = None
+        mejor_distancia = None
+        for parque in self.parques:
+            px, py = parque
+            distancia = abs(px - x0) + abs(py - y0)
+            if mejor_distancia is None or distancia < mejor_distancia:
+                mejor = parque
+                mejor_distancia = distancia
+        
+        self._parque_cercano[posicion] = mejor
+        return mejor
+    
     def _generar_lista_parques(self) -> List[Tuple[int, int]]:
         """
         Genera lista de posiciones de parques para búsqueda rápida.
@@ -1033,46 +1214,63 @@ class DengueModel(Model):
         
         infectados_asignados = 0
         
-        for i in range(num_humanos):
-            # Determinar tipo de movilidad
-            rand = self.random.random()
-            acum = 0
-            tipo = TipoMovilidad.ESTACIONARIO
-            for t, prob in tipos_dist:
-                acum += prob
-                if rand < acum:
-                    tipo = t
-                    break
-            
-            # Asignar hogar en celda urbana (fija para toda la simulación)
-            # Selección directa desde lista pre-calculada: O(1) vs O(100) del método anterior
-            pos_hogar = self.random.choice(self.celdas_urbanas)
-            
-            # Asignar destino (escuela/trabajo) en celda urbana para estudiantes y trabajadores
-            # Esta posición es FIJA (no cambia durante la simulación)
-            # Las visitas al parque se manejan aparte en la lógica de movilidad del agente
-            pos_destino = None
-            if tipo in [TipoMovilidad.ESTUDIANTE, TipoMovilidad.TRABAJADOR]:
-                pos_destino = self.random.choice(self.celdas_urbanas)
-            
-            # Crear agente
-            unique_id = self.next_id()
-            humano = HumanAgent(
-                unique_id=unique_id,
-                model=self,
-                tipo_movilidad=tipo,
-                pos_hogar=pos_hogar,
-                pos_destino=pos_destino
-            )
-            
-            # Asignar estado infectado a algunos
-            if infectados_asignados < infectados_iniciales:
-                humano.estado = EstadoSalud.INFECTADO
-                infectados_asignados += 1
-            
-            # Colocar en grid y agregar a scheduler
-            self.grid.place_agent(humano, pos_hogar)
-            self.agents.add(humano)
+        # OPTIMIZACIÓN: Valores invariantes del bucle en variables locales
+        # (miembros de Enum, método de sorteo, lista de celdas) e IDs
+        # reservados en bloque. Los sorteos se hacen en el mismo orden, por lo
+        # que la población generada con una semilla no cambia
+        elegir = self.random.choice
+        aleatorio = self.random.random
+        celdas_urbanas = self.celdas_urbanas
+        estacionario = TipoMovilidad.ESTACIONARIO
+        tipos_con_destino = (TipoMovilidad.ESTUDIANTE, TipoMovilidad.TRABAJADOR)
+        ids = self.next_id_range(num_humanos)
+        
+        # Probabilidades acumuladas (mismas sumas sucesivas que el recorrido
+        # lineal); el tipo es el primero cuya acumulada supera el sorteo y,
+        # si ninguna lo supera, ESTACIONARIO
+        tipos = [t for t, _ in tipos_dist] + [estacionario]
+        acumuladas = list(accumulate(prob for _, prob in tipos_dist))
+        
+        # OPTIMIZACIÓN: El recolector cíclico se pausa mientras se crean los
+        # agentes; cada HumanAgent dispara asignaciones que, en poblaciones
+        # grandes, provocan recorridos completos del GC sin nada que liberar
+        with _gc_pausado():
+            for unique_id in ids:
+                # Determinar tipo de movilidad (búsqueda binaria en las acumuladas)
+                tipo = tipos[bisect_right(acumuladas, aleatorio())]
+                
+                # Asignar hogar en celda urbana (fija para toda la simulación)
+                # Selección directa desde lista pre-calculada: O(1) vs O(100) del método anterior
+                pos_hogar = elegir(celdas_urbanas)
+                
+                # Asignar destino (escuela/trabajo) en celda urbana para estudiantes y trabajadores
+                # Esta posición es FIJA (no cambia durante la simulación)
+                # Las visitas al parque se manejan aparte en la lógica de movilidad del agente
+                pos_destino = None
+                if tipo in tipos_con_destino:
+                    pos_destino = elegir(celdas_urbanas)
+                
+                # Crear agente
+                humano = HumanAgent(
+                    unique_id=unique_id,
+                    model=self,
+                    tipo_movilidad=tipo,
+                    pos_hogar=pos_hogar,
+                    pos_destino=pos_destino
+                )
+                
+                # Asignar estado infectado a algunos
+                if infectados_asignados < infectados_iniciales:
+                    humano.estado = EstadoSalud.INFECTADO
+                    infectados_asignados += 1
+                
+                # Colocar en grid e índice espacial (Agent.__init__ ya registra
+                # al agente en el modelo; model.agents construye un AgentSet
+                # nuevo en cada acceso, por lo que agregarlo ahí es O(N) e inútil)
+                self.grid.place_agent(humano, pos_hogar)
+                self.indice_humanos.agregar(humano, pos_hogar)
+                self.conteo_humanos[humano.estado] += 1
+                self.humanos.append(humano)
     
     def _crear_mosquitos(self, num_mosquitos: int, infectados_iniciales: int):
         """
@@ -1097,61 +1295,46 @@ class DengueModel(Model):
         mosquitos_susceptibles = num_mosquitos - infectados_iniciales
         mosquitos_infectados = infectados_iniciales
         
-        # Distribuir susceptibles
-        for _ in range(mosquitos_susceptibles):
-            if self.sitios_cria and self.random.random() < 0.8:
-                # 80% en sitios de cría
-                pos = self.random.choice(self.sitios_cria)
-            else:
-                # 20% en celdas aleatorias
-                pos = (self.random.randrange(self.width),
-                      self.random.randrange(self.height))
-            
-            from .mosquito_population import MosquitoState
-            self.mosquito_pop.add_mosquitos(pos, 1, MosquitoState.SUSCEPTIBLE)
-        
-        # Distribuir infectados
-        for _ in range(mosquitos_infectados):
-            if self.sitios_cria and self.random.random() < 0.8:
-                pos = self.random.choice(self.sitios_cria)
-            else:
-                pos = (self.random.randrange(self.width),
-                      self.random.randrange(self.height))
-            
-            from .mosquito_population import MosquitoState
-            self.mosquito_pop.add_mosquitos(pos, 1, MosquitoState.INFECTIOUS)
+        # Distribuir susceptibles y luego infectados (mismo orden de sorteos).
+        # OPTIMIZACIÓN: las celdas sorteadas se suman al grid en una sola
+        # operación por estado en lugar de un acceso a NumPy por mosquito
+        for cantidad, estado in ((mosquitos_susceptibles, MosquitoState.SUSCEPTIBLE),
+                                 (mosquitos_infectados, MosquitoState.INFECTIOUS)):
+            xs, ys = self._sortear_celdas_mosquitos(cantidad)
+            self.mosquito_pop.add_mosquitos_batch(
+                np.array(xs, dtype=np.intp),
+                np.array(ys, dtype=np.intp),
+                np.ones(len(xs), dtype=np.int32),
+                estado
+            )
     
-    def _crear_huevos(self, num_huevos: int):
+    def _sortear_celdas_mosquitos(self, cantidad: int) -> Tuple[List[int], List[int]]:
         """
-        Crea la población inicial de huevos (solo hembras).
-        
-        Los huevos se colocan en sitios de cría aleatorios.
-        Solo se crean huevos hembra ya que los machos no aportan al modelo.
+        Sortea la celda inicial de cada mosquito.
         
         Parameters
         ----------
-        num_huevos : int
-            Número total de huevos hembra a crear
+        cantidad : int
+            Número de mosquitos a ubicar
+            
+        Returns
+        -------
+        Tuple[List[int], List[int]]
+            Coordenadas x e y de la celda de cada mosquito
         """
-        for i in range(num_huevos):
-            # Sitio de cría aleatorio
-            if self.sitios_cria:
-                sitio = self.random.choice(self.sitios_cria)
+        xs = []
+        ys = []
+        for _ in range(cantidad):
+            if self.sitios_cria and self.random.random() < 0.8:
+                # 80% en sitios de cría
+                x, y = self.random.choice(self.sitios_cria)
             else:
-                sitio = (self.random.randrange(self.width),
-                        self.random.randrange(self.height))
-            
-            # Crear huevo hembra
-            unique_id = self.next_id()
-            huevo = MosquitoAgent(
-                unique_id=unique_id,
-                model=self,
-                etapa=EtapaVida.HUEVO,
-                sitio_cria=sitio
-            )
-            
-            # Agregar a scheduler (no al grid hasta eclosionar)
-            self.agents.add(huevo)
+                # 20% en celdas aleatorias
+                x = self.random.randrange(self.width)
+                y = self.random.randrange(self.height)
+            xs.append(x)
+            ys.append(y)
+        return xs, ys
     
     def next_id(self) -> int:
         """
@@ -1166,16 +1349,34 @@ class DengueModel(Model):
         self._next_id += 1
         return current_id
     
+    def next_id_range(self, n: int) -> range:
+        """
+        Reserva un bloque contiguo de n IDs únicos.
+        
+        OPTIMIZACIÓN: Una sola actualización del contador en vez de n
+        llamadas a next_id() cuando se crean muchos agentes a la vez.
+        
+        Parameters
+        ----------
+        n : int
+            Número de IDs a reservar
+        
+        Returns
+        -------
+        range
+            IDs reservados [base, base + n)
+        """
+        base = self._next_id
+        self._next_id += n
+        return range(base, base + n)
+    
     def _contar_humanos_estado(self, estado: EstadoSalud) -> int:
         """Cuenta humanos en un estado epidemiológico específico."""
-        return sum(1 for a in self.agents 
-                  if isinstance(a, HumanAgent) and a.estado == estado)
+        return self.conteo_humanos[estado]
     
     def _contar_mosquitos_estado(self, estado: EstadoMosquito) -> int:
         """Cuenta mosquitos adultos en un estado epidemiológico específico."""
         # Usar grid de poblaciones
-        from .mosquito_population import MosquitoState
-        
         if estado == EstadoMosquito.SUSCEPTIBLE:
             return self.mosquito_pop.S_m.sum()
         elif estado == EstadoMosquito.INFECTADO:
@@ -10,7 +10,12 @@ Universidad Industrial de Santander - Simulación Digital F1
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple, TYPE_CHECKING
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from .mosquito_population import MosquitoState
+from ..agents.mosquito_agent import MosquitoAgent, EtapaVida
 
 if TYPE_CHECKING:
     from .dengue_model import DengueModel
@@ -58,6 +63,10 @@ class EggManager:
     - Constante térmica: 181.2 °C·día (K_inmaduro)
     - Fórmula: GD_dia = max(T_dia - T_base, 0)
     
+    OPTIMIZACIÓN: Los lotes se almacenan como columnas NumPy (estructura de
+    arreglos) en lugar de una lista de objetos EggBatch. El desarrollo diario
+    de todos los lotes se calcula con una sola operación vectorizada.
+    
     Parameters
     ----------
     model : DengueModel
@@ -67,8 +76,18 @@ class EggManager:
     ----------
     model : DengueModel
         Modelo al que pertenece el gestor
-    egg_batches : List[EggBatch]
-        Lista de lotes de huevos activos
+    egg_batches : Tuple[EggBatch, ...]
+        Copias de solo lectura de los lotes de huevos activos
+    num_batches : int
+        Número de lotes activos (también disponible como ``len(manager)``)
+    
+    Notes
+    -----
+    ``egg_batches`` ya no es la lista interna de lotes: cada acceso construye
+    copias nuevas desde las columnas y las devuelve en una tupla, por lo que
+    agregar o quitar lotes a través de ella lanza una excepción. Para alterar
+    lotes debe usarse ``add_eggs``/``add_eggs_batch``; para contarlos,
+    ``num_batches`` evita construir los objetos.
     """
     
     def __init__(self, model: 'DengueModel'):
@@ -81,7 +100,83 @@ class EggManager:
             Modelo principal de la simulación
         """
         self.model = model
-        self.egg_batches: List[EggBatch] = []
+        
+        # Columnas de lotes (un elemento por lote)
+        # OPTIMIZACIÓN: tipos compactos donde el rango lo permite. Las
+        # coordenadas usan int16 si la grilla cabe en ese rango (si no, int32);
+        # los días como huevo y las cantidades usan int32 (un contador de días
+        # en int16 se desbordaría en silencio en corridas muy largas). Los
+        # grados-día se mantienen en float64: en float32 el redondeo podría
+        # adelantar o retrasar una eclosión al comparar con la constante térmica
+        if max(model.grid.width, model.grid.height) <= np.iinfo(np.int16).max + 1:
+            self._dtype_sitio = np.int16
+        else:
+            self._dtype_sitio = np.int32
+        self._sitio_x = np.zeros(0, dtype=self._dtype_sitio)
+        self._sitio_y = np.zeros(0, dtype=self._dtype_sitio)
+        self._cantidad = np.zeros(0, dtype=np.int32)
+        self._grados = np.zeros(0, dtype=np.float64)
+        self._dias = np.zeros(0, dtype=np.int32)
+        self._fecha = np.zeros(0, dtype=np.int32)
+        
+        # Lotes nuevos del día pendientes de anexar a las columnas. Las puestas
+        # se acumulan en listas y se vuelcan con un único np.concatenate
+        # cuando se necesita leer las columnas (ver _volcar_pendientes)
+        self._pendientes_x: List[int] = []
+        self._pendientes_y: List[int] = []
+        self._pendientes_cantidad: List[int] = []
+        
+        # Índice {sitio: posición del lote} de los lotes puestos en _dia_indice
+        # (permite agrupar puestas del mismo día sin recorrer todos los lotes).
+        # Las posiciones >= len(_cantidad) corresponden a lotes pendientes.
+        self._indice_dia: Dict[Tuple[int, int], int] = {}
+        self._dia_indice = None
+    
+    @property
+    def egg_batches(self) -> Tuple[EggBatch, ...]:
+        """
+        Lotes de huevos activos como objetos EggBatch.
+        
+        Se construyen bajo demanda desde las columnas internas; modificar
+        los objetos retornados no altera el estado del gestor. Se devuelve
+        una tupla para que los intentos de agregar o quitar lotes fallen
+        en lugar de perderse en silencio.
+        
+        Returns
+        -------
+        Tuple[EggBatch, ...]
+            Lotes activos en orden de creación
+        """
+        self._volcar_pendientes()
+        return tuple(
+            EggBatch(
+                sitio_cria=(int(x), int(y)),
+                cantidad=int(c),
+                grados_acumulados=float(g),
+                dias_como_huevo=int(d),
+                fecha_puesta=int(f)
+            )
+            for x, y, c, g, d, f in zip(
+                self._sitio_x, self._sitio_y, self._cantidad,
+                self._grados, self._dias, self._fecha
+            )
+        )
+    
+    @property
+    def num_batches(self) -> int:
+        """
+        Número de lotes activos, sin construir objetos EggBatch.
+        
+        Returns
+        -------
+        int
+            Lotes en las columnas más lotes pendientes de volcar
+        """
+        return len(self._cantidad) + len(self._pendientes_cantidad)
+    
+    def __len__(self) -> int:
+        """Número de lotes activos (equivale a ``num_batches``)."""
+        return self.num_batches
     
     def add_eggs(self, sitio_cria: Tuple[int, int], cantidad: int):
         """
@@ -104,61 +199,193 @@ class EggManager:
         if cantidad <= 0:
             return
         
-        # Buscar lote existente en el mismo sitio y mismo día
+        self._preparar_dia()
+        self._registrar_puesta(int(sitio_cria[0]), int(sitio_cria[1]), int(cantidad))
+    
+    def add_eggs_batch(self, xs: np.ndarray, ys: np.ndarray,
+                       cantidades: np.ndarray):
+        """
+        Agrega varios lotes de huevos en una sola operación.
+        
+        Equivale a llamar add_eggs((xs[i], ys[i]), cantidades[i]) para cada i
+        en orden, convirtiendo los arrays a listas de Python una sola vez.
+        
+        Parameters
+        ----------
+        xs : np.ndarray
+            Coordenadas x de los sitios de cría
+        ys : np.ndarray
+            Coordenadas y de los sitios de cría
+        cantidades : np.ndarray
+            Número de huevos por sitio
+        """
+        self._preparar_dia()
+        
+        for x, y, cantidad in zip(np.asarray(xs).tolist(), np.asarray(ys).tolist(),
+                                  np.asarray(cantidades).tolist()):
+            if cantidad > 0:
+                self._registrar_puesta(x, y, cantidad)
+    
+    def _preparar_dia(self):
+        """
+        Asegura que el índice de agrupación corresponda al día actual.
+        
+        Al cambiar de día los lotes pendientes (del día anterior) se vuelcan
+        a las columnas antes de reconstruir el índice.
+        """
         dia_actual = self.model.dia_simulacion
-        for batch in self.egg_batches:
-            if batch.sitio_cria == sitio_cria and batch.fecha_puesta == dia_actual:
-                batch.cantidad += cantidad
-                return
-        
-        # Crear nuevo lote
-        self.egg_batches.append(EggBatch(
-            sitio_cria=sitio_cria,
-            cantidad=cantidad,
-            grados_acumulados=0.0,
-            dias_como_huevo=0,
-            fecha_puesta=dia_actual
-        ))
+        if self._dia_indice != dia_actual:
+            self._volcar_pendientes()
+            self._reconstruir_indice_dia(dia_actual)
+    
+    def _registrar_puesta(self, x: int, y: int, cantidad: int):
+        """
+        Registra una puesta del día en el lote del sitio o en uno pendiente.
+        
+        Parameters
+        ----------
+        x, y : int
+            Coordenadas del sitio de cría
+        cantidad : int
+            Número de huevos (> 0)
+        """
+        # Buscar lote existente en el mismo sitio y mismo día
+        idx = self._indice_dia.get((x, y))
+        n_actual = len(self._cantidad)
+        
+        if idx is None:
+            # Crear nuevo lote (pendiente de anexar)
+            self._indice_dia[(x, y)] = n_actual + len(self._pendientes_cantidad)
+            self._pendientes_x.append(x)
+            self._pendientes_y.append(y)
+            self._pendientes_cantidad.append(cantidad)
+        elif idx < n_actual:
+            self._cantidad[idx] += cantidad
+        else:
+            self._pendientes_cantidad[idx - n_actual] += cantidad
+    
+    def _volcar_pendientes(self):
+        """
+        Anexa los lotes pendientes a las columnas con un único np.concatenate.
+        
+        Los lotes pendientes siempre pertenecen al día _dia_indice, y sus
+        posiciones en el índice ya apuntan a su lugar final en las columnas.
+        """
+        n_nuevos = len(self._pendientes_cantidad)
+        if n_nuevos == 0:
+            return
+        
+        self._sitio_x = np.concatenate((self._sitio_x, np.array(self._pendientes_x, dtype=self._dtype_sitio)))
+        self._sitio_y = np.concatenate((self._sitio_y, np.array(self._pendientes_y, dtype=self._dtype_sitio)))
+        self._cantidad = np.concatenate((self._cantidad, np.array(self._pendientes_cantidad, dtype=np.int32)))
+        self._grados = np.concatenate((self._grados, np.zeros(n_nuevos, dtype=np.float64)))
+        self._dias = np.concatenate((self._dias, np.zeros(n_nuevos, dtype=np.int32)))
+        self._fecha = np.concatenate((self._fecha, np.full(n_nuevos, self._dia_indice, dtype=np.int32)))
+        
+        self._pendientes_x = []
+        self._pendientes_y = []
+        self._pendientes_cantidad = []
+    
+    def _reconstruir_indice_dia(self, dia: int):
+        """
+        Reconstruye el índice de lotes puestos en el día indicado.
+        
+        Se invoca al cambiar de día y después de compactar las columnas
+        (las posiciones de los lotes cambian al eliminar lotes). Requiere
+        que no haya lotes pendientes.
+        
+        Parameters
+        ----------
+        dia : int
+            Día de simulación a indexar
+        """
+        self._dia_indice = dia
+        self._indice_dia = {
+            (int(self._sitio_x[i]), int(self._sitio_y[i])): int(i)
+            for i in np.flatnonzero(self._fecha == dia)
+        }
+    
+    def _compactar(self, conservar: np.ndarray):
+        """
+        Elimina los lotes marcados como False en la máscara.
+        
+        Parameters
+        ----------
+        conservar : np.ndarray
+            Máscara booleana con los lotes que permanecen activos
+        """
+        self._sitio_x = self._sitio_x[conservar]
+        self._sitio_y = self._sitio_y[conservar]
+        self._cantidad = self._cantidad[conservar]
+        self._grados = self._grados[conservar]
+        self._dias = self._dias[conservar]
+        self._fecha = self._fecha[conservar]
+        
+        # Las posiciones cambiaron: invalidar índice del día
+        self._dia_indice = None
     
     def step(self):
         """
         Procesa el desarrollo de todos los lotes de huevos.
         
         Aplica el modelo de grados-día acumulados (GDD) a cada lote:
-        1. Calcula grados-día del día actual
+        1. Obtiene los grados-día del día actual (calculados por el modelo)
         2. Acumula en cada lote
         3. Identifica lotes que alcanzaron la constante térmica
         4. Eclosiona los lotes maduros
         
+        Los pasos 2 a 4 se ejecutan como operaciones vectorizadas sobre las
+        columnas de todos los lotes (la eclosión es una sola suma al grid de
+        poblaciones de mosquitos).
+        
         Este método se llama una vez por día de simulación.
         """
-        # Obtener temperatura actual del modelo
-        temperatura = self.model.temperatura_actual
+        self._volcar_pendientes()
+        if len(self._cantidad) == 0:
+            return
         
-        # Calcular contribución diaria de grados-día
-        # GD_dia = max(T_dia - T_base_inmaduro, 0)
-        umbral = self.model.immature_development_threshold  # 8.3°C
-        grados_dia = max(temperatura - umbral, 0.0)
+        # Contribución diaria de grados-día, calculada por el modelo al
+        # actualizar el clima: GD_dia = max(T_dia - T_base_inmaduro, 0)
+        grados_dia = self.model.grados_dia_actual
         
-        # Lotes que alcanzaron madurez
-        batches_to_hatch = []
+        # Actualizar todos los lotes y verificar si alcanzaron la
+        # constante térmica (181.2 °C·día)
+        self._grados += grados_dia
+        self._dias += 1
+        maduros = self._grados >= self.model.immature_thermal_constant
         
-        # Actualizar cada lote
-        for batch in self.egg_batches:
-            batch.grados_acumulados += grados_dia
-            batch.dias_como_huevo += 1
-            
-            # Verificar si alcanzó la constante térmica (181.2 °C·día)
-            if batch.grados_acumulados >= self.model.immature_thermal_constant:
-                batches_to_hatch.append(batch)
+        if not maduros.any():
+            return
+        
+        idx = np.flatnonzero(maduros)
+        
+        if hasattr(self.model, 'mosquito_pop'):
+            # MODELO METAPOBLACIONAL: todos los lotes maduros se suman al
+            # grid de poblaciones en una sola operación (la suma no depende
+            # del orden de eclosión)
+            self.model.mosquito_pop.add_mosquitos_batch(
+                self._sitio_x[idx],
+                self._sitio_y[idx],
+                self._cantidad[idx],
+                MosquitoState.SUSCEPTIBLE
+            )
+            self._compactar(~maduros)
+            return
         
         # Eclosionar lotes maduros (ordenados para reproducibilidad)
         # Ordenar por fecha de puesta y luego por sitio para determinismo con seed
-        batches_to_hatch.sort(key=lambda b: (b.fecha_puesta, b.sitio_cria))
+        orden = np.lexsort((self._sitio_y[idx], self._sitio_x[idx], self._fecha[idx]))
+        
+        for i in idx[orden]:
+            self._hatch_batch(EggBatch(
+                sitio_cria=(int(self._sitio_x[i]), int(self._sitio_y[i])),
+                cantidad=int(self._cantidad[i]),
+                grados_acumulados=float(self._grados[i]),
+                dias_como_huevo=int(self._dias[i]),
+                fecha_puesta=int(self._fecha[i])
+            ))
         
-        for batch in batches_to_hatch:
-            self._hatch_batch(batch)
-            self.egg_batches.remove(batch)
+        self._compactar(~maduros)
     
     def _hatch_batch(self, batch: EggBatch):
         """
@@ -177,7 +404,6 @@ class EggManager:
         # (modelo metapoblacional - no crear agentes individuales)
         if hasattr(self.model, 'mosquito_pop'):
             # Usar modelo metapoblacional
-            from .mosquito_population import MosquitoState
             self.model.mosquito_pop.add_mosquitos(
                 batch.sitio_cria, 
                 batch.cantidad,
@@ -185,20 +411,19 @@ class EggManager:
             )
         else:
             # Fallback: crear agentes individuales (versión antigua)
-            from ..agents.mosquito_agent import MosquitoAgent, EtapaVida
-            
-            for _ in range(batch.cantidad):
+            # Reservar todos los IDs del lote de una vez
+            for unique_id in self.model.next_id_range(batch.cantidad):
                 # Crear mosquito adulto
                 mosquito = MosquitoAgent(
-                    unique_id=self.model.next_id(),
+                    unique_id=unique_id,
                     model=self.model,
                     etapa=EtapaVida.ADULTO,
                     sitio_cria=batch.sitio_cria
                 )
                 
-                # Colocar en el sitio de cría
+                # Colocar en el sitio de cría (Agent.__init__ ya lo registra
+                # en el modelo)
                 self.model.grid.place_agent(mosquito, batch.sitio_cria)
-                self.model.agents.add(mosquito)
     
     def count_eggs(self) -> int:
         """
@@ -209,7 +434,8 @@ class EggManager:
         int
             Número total de huevos
         """
-        return sum(batch.cantidad for batch in self.egg_batches)
+        self._volcar_pendientes()
+        return int(self._cantidad.sum())
     
     def apply_mortality(self, mortality_rate: float):
         """
@@ -218,32 +444,35 @@ class EggManager:
         Reduce la cantidad de huevos en cada lote según la tasa de mortalidad.
         Elimina lotes que quedan sin huevos.
         
+        OPTIMIZACIÓN: El redondeo estocástico de todos los lotes usa un único
+        sorteo de NumPy en lugar de una llamada a random() por lote.
+        
         Parameters
         ----------
         mortality_rate : float
             Tasa de mortalidad diaria (0.0 a 1.0)
             Ejemplo: 0.03 = 3% de mortalidad por día
         """
-        batches_to_remove = []
+        self._volcar_pendientes()
+        if len(self._cantidad) == 0:
+            return
         
-        for batch in self.egg_batches:
-            # Calcular muertes (redondeo estocástico)
-            muertes_esperadas = batch.cantidad * mortality_rate
-            muertes = int(muertes_esperadas)
-            
-            # Probabilidad de muerte adicional (parte fraccionaria)
-            if self.model.random.random() < (muertes_esperadas - muertes):
-                muertes += 1
-            
-            batch.cantidad -= muertes
-            
-            # Marcar para eliminación si no quedan huevos
-            if batch.cantidad <= 0:
-                batches_to_remove.append(batch)
+        # Calcular muertes (redondeo estocástico)
+        muertes_esperadas = self._cantidad * mortality_rate
+        muertes = muertes_esperadas.astype(np.int64)
+        
+        # Probabilidad de muerte adicional (parte fraccionaria): un solo
+        # sorteo vectorizado para todos los lotes con el generador NumPy
+        # del modelo (sembrado con su seed, independiente de np.random)
+        sorteos = self.model.rng_np.random(len(muertes))
+        muertes += sorteos < (muertes_esperadas - muertes)
+        
+        self._cantidad -= muertes
         
         # Eliminar lotes vacíos
-        for batch in batches_to_remove:
-            self.egg_batches.remove(batch)
+        vivos = self._cantidad > 0
+        if not vivos.all():
+            self._compactar(vivos)
     
     def apply_lsm_control(self, coverage: float, effectiveness: float):
         """
@@ -261,26 +490,32 @@ class EggManager:
             Efectividad del tratamiento (0.0 a 1.0)
             Ejemplo: 0.8 = 80% de reducción en sitios tratados
         """
+        self._volcar_pendientes()
         reduccion_total = coverage * effectiveness
-        batches_to_remove = []
+        conservar = np.ones(len(self._cantidad), dtype=bool)
         
-        for batch in self.egg_batches:
+        # Los sorteos usan model.random en el mismo orden que antes (el
+        # segundo solo si el primero falla), por lo que no se vectorizan.
+        # OPTIMIZACIÓN: el bucle recorre una lista de enteros de Python y
+        # escribe en la columna solo los lotes reducidos
+        aleatorio = self.model.random.random
+        for i, cantidad in enumerate(self._cantidad.tolist()):
             # Decidir si este lote es afectado por el control
-            if self.model.random.random() < reduccion_total:
+            if aleatorio() < reduccion_total:
                 # Eliminar lote completo (tratamiento efectivo)
-                batches_to_remove.append(batch)
-            elif self.model.random.random() < coverage:
+                conservar[i] = False
+            elif aleatorio() < coverage:
                 # Lote tratado pero no completamente efectivo
                 # Reducir cantidad según efectividad
-                reduccion = int(batch.cantidad * effectiveness)
-                batch.cantidad -= reduccion
+                cantidad -= int(cantidad * effectiveness)
+                self._cantidad[i] = cantidad
                 
-                if batch.cantidad <= 0:
-                    batches_to_remove.append(batch)
+                if cantidad <= 0:
+                    conservar[i] = False
         
         # Eliminar lotes afectados
-        for batch in batches_to_remove:
-            self.egg_batches.remove(batch)
+        if not conservar.all():
+            self._compactar(conservar)
     
     def get_eggs_by_site(self, sitio: Tuple[int, int]) -> int:
         """
@@ -298,11 +533,10 @@ class EggManager:
         int
             Número total de huevos en ese sitio
         """
-        return sum(batch.cantidad for batch in self.egg_batches 
-                   if batch.sitio_cria == sitio)
+        self._volcar_pendientes()
+        en_sitio = (self._sitio_x == sitio[0]) & (self._sitio_y == sitio[1])
+        return int(self._cantidad[en_sitio].sum())
     
     def __repr__(self) -> str:
         """Representación en cadena del gestor."""
-        total_eggs = self.count_eggs()
-        num_batches = len(self.egg_batches)
-        return f"EggManager(batches={num_batches}, total_eggs={total_eggs})"
+        return f"EggManager(batches={self.num_batches}, total_eggs={self.count_eggs()})"
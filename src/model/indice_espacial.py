@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Índice espacial de humanos para el modelo ABM del Dengue.
+
+Este módulo implementa una rejilla uniforme de sectores que agrupa a los
+agentes humanos según su posición, permitiendo consultar los humanos
+cercanos a una celda sin recorrer el vecindario completo del MultiGrid
+de Mesa ni filtrar agentes por tipo.
+
+Autor: Yeison Adrián Cáceres Torres, William Urrutia Torres, Jhon Anderson Vargas Gómez
+Universidad Industrial de Santander - Simulación Digital F1
+"""
+
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..agents.human_agent import HumanAgent
+
+
+class IndiceEspacialHumanos:
+    """
+    Rejilla uniforme de sectores con los humanos de cada sector.
+
+    El grid se divide en sectores cuadrados de lado tamano_sector. Con un
+    tamaño de sector igual al radio de búsqueda, una consulta revisa como
+    máximo 3×3 sectores en lugar de las (2·r+1)² celdas del vecindario Moore,
+    y solo itera sobre humanos (nunca sobre otros tipos de agente).
+
+    Además mantiene un índice invertido por celda, de modo que obtener los
+    humanos de una celda concreta es una búsqueda O(1) en un diccionario,
+    y un contador de humanos infecciosos por celda para que la transmisión
+    no tenga que revisar el estado de cada humano del grid.
+
+    El índice se mantiene incrementalmente: el modelo registra cada humano
+    al crearlo, HumanAgent.mover_a notifica cada cambio de celda y
+    HumanAgent.actualizar_estado_seir cada entrada o salida del estado I.
+
+    Parameters
+    ----------
+    tamano_sector : int
+        Lado de cada sector en celdas (típicamente sensory_range)
+
+    Attributes
+    ----------
+    tamano_sector : int
+        Lado de cada sector en celdas
+    sectores : Dict[Tuple[int, int], List[HumanAgent]]
+        Humanos agrupados por sector {(sector_x, sector_y): [humanos]}
+    celdas : Dict[Tuple[int, int], List[HumanAgent]]
+        Humanos agrupados por celda {(x, y): [humanos]}
+    infecciosos : Dict[Tuple[int, int], int]
+        Número de humanos infecciosos por celda (solo celdas con al menos uno)
+    """
+
+    def __init__(self, tamano_sector: int):
+        self.tamano_sector = max(1, int(tamano_sector))
+        self.sectores: Dict[Tuple[int, int], List['HumanAgent']] = {}
+        self.celdas: Dict[Tuple[int, int], List['HumanAgent']] = {}
+        self.infecciosos: Dict[Tuple[int, int], int] = {}
+
+    def _sector(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """Retorna el sector que contiene la posición."""
+        return (pos[0] // self.tamano_sector, pos[1] // self.tamano_sector)
+
+    def _sumar_infecciosos(self, pos: Tuple[int, int], delta: int):
+        """Ajusta el contador de infecciosos de una celda (borra los ceros)."""
+        total = self.infecciosos.get(pos, 0) + delta
+        if total > 0:
+            self.infecciosos[pos] = total
+        else:
+            self.infecciosos.pop(pos, None)
+
+    def agregar(self, humano: 'HumanAgent', pos: Tuple[int, int]):
+        """
+        Registra un humano en el sector de la posición dada.
+
+        Parameters
+        ----------
+        humano : HumanAgent
+            Humano a registrar
+        pos : Tuple[int, int]
+            Posición actual del humano
+        """
+        sector = self._sector(pos)
+        if sector not in self.sectores:
+            self.sectores[sector] = []
+        self.sectores[sector].append(humano)
+        if pos not in self.celdas:
+            self.celdas[pos] = []
+        self.celdas[pos].append(humano)
+        if humano.es_infeccioso():
+            self._sumar_infecciosos(pos, 1)
+
+    def remover(self, humano: 'HumanAgent', pos: Tuple[int, int]):
+        """
+        Elimina un humano del sector de la posición dada.
+
+        Parameters
+        ----------
+        humano : HumanAgent
+            Humano a eliminar
+        pos : Tuple[int, int]
+            Posición en la que fue registrado
+        """
+        self.sectores[self._sector(pos)].remove(humano)
+        self.celdas[pos].remove(humano)
+        if humano.es_infeccioso():
+            self._sumar_infecciosos(pos, -1)
+
+    def mover(self, humano: 'HumanAgent', pos_anterior: Tuple[int, int],
+              pos_nueva: Tuple[int, int]):
+        """
+        Actualiza el índice tras un movimiento del humano.
+
+        El índice por celda se actualiza siempre; el de sectores solo si el
+        humano cambia de sector (las consultas leen la posición exacta desde
+        humano.pos).
+
+        Parameters
+        ----------
+        humano : HumanAgent
+            Humano que se movió
+        pos_anterior : Tuple[int, int]
+            Posición antes del movimiento
+        pos_nueva : Tuple[int, int]
+            Posición después del movimiento
+        """
+        if pos_anterior != pos_nueva:
+            self.celdas[pos_anterior].remove(humano)
+            if pos_nueva not in self.celdas:
+                self.celdas[pos_nueva] = []
+            self.celdas[pos_nueva].append(humano)
+            if humano.es_infeccioso():
+                self._sumar_infecciosos(pos_anterior, -1)
+                self._sumar_infecciosos(pos_nueva, 1)
+
+        sector_anterior = self._sector(pos_anterior)
+        sector_nuevo = self._sector(pos_nueva)
+        if sector_anterior == sector_nuevo:
+            return
+        self.sectores[sector_anterior].remove(humano)
+        if sector_nuevo not in self.sectores:
+            self.sectores[sector_nuevo] = []
+        self.sectores[sector_nuevo].append(humano)
+
+    def actualizar_infeccioso(self, humano: 'HumanAgent', infeccioso: bool):
+        """
+        Registra que un humano entró o salió del estado infeccioso.
+
+        Parameters
+        ----------
+        humano : HumanAgent
+            Humano que cambió de estado (en su posición actual)
+        infeccioso : bool
+            True si pasó a ser infeccioso, False si dejó de serlo
+        """
+        self._sumar_infecciosos(humano.pos, 1 if infeccioso else -1)
+
+    def en_celda(self, pos: Tuple[int, int]) -> List['HumanAgent']:
+        """
+        Obtiene los humanos ubicados exactamente en una celda.
+
+        Parameters
+        ----------
+        pos : Tuple[int, int]
+            Coordenadas (x, y) de la celda
+
+        Returns
+        -------
+        List[HumanAgent]
+            Humanos en la celda (lista vacía si no hay ninguno). La lista
+            pertenece al índice y no debe modificarse.
+        """
+        return self.celdas.get(pos, [])
+
+    def consultar(self, pos: Tuple[int, int], radio: int,
+                  incluir_centro: bool = True) -> List['HumanAgent']:
+        """
+        Obtiene los humanos dentro de un vecindario Moore de radio dado.
+
+        Equivale a filtrar humanos en grid.get_neighbors(pos, moore=True,
+        radius=radio): se conservan los humanos con distancia de Chebyshev
+        menor o igual al radio.
+
+        Parameters
+        ----------
+        pos : Tuple[int, int]
+            Centro de la consulta
+        radio : int
+            Radio del vecindario Moore (celdas)
+        incluir_centro : bool, default=True
+            Si False, excluye a los humanos ubicados en la celda central
+
+        Returns
+        -------
+        List[HumanAgent]
+            Humanos dentro del vecindario
+        """
+        x, y = pos
+        s = self.tamano_sector
+        sectores = self.sectores
+        humanos = []
+
+        for sector_x in range((x - radio) // s, (x + radio) // s + 1):
+            for sector_y in range((y - radio) // s, (y + radio) // s + 1):
+                lista = sectores.get((sector_x, sector_y))
+                if not lista:
+                    continue
+                for humano in lista:
+                    hx, hy = humano.pos
+                    if abs(hx - x) <= radio and abs(hy - y) <= radio:
+                        if incluir_centro or hx != x or hy != y:
+                            humanos.append(humano)
+
+        return humanos
+
+    def __len__(self) -> int:
+        """Número total de humanos registrados."""
+        return sum(len(lista) for lista in self.sectores.values())
+
+    def __repr__(self) -> str:
+        """Representación en cadena del índice."""
+        return (f"IndiceEspacialHumanos(sectores={len(self.sectores)}, "
+                f"humanos={len(self)}, tamano_sector={self.tamano_sector})")
@@ -11,19 +11,32 @@ Autor: Yeison Adrián Cáceres Torres, William Urrutia Torres, Jhon Anderson Var
 Universidad Industrial de Santander - Simulación Digital F1
 """
 
+import math
 import numpy as np
 from typing import TYPE_CHECKING, Tuple, List
-from enum import Enum
+from enum import IntEnum
+
+from ..agents.human_agent import EstadoSalud
 
 if TYPE_CHECKING:
     from .dengue_model import DengueModel
 
+# Alias de módulo de los estados humanos leídos en la transmisión
+_SUSCEPTIBLE = EstadoSalud.SUSCEPTIBLE
+_INFECTADO = EstadoSalud.INFECTADO
+
 
-class MosquitoState(Enum):
-    """Estados epidemiológicos de mosquitos"""
-    SUSCEPTIBLE = "S"
-    EXPOSED = "E"
-    INFECTIOUS = "I"
+class MosquitoState(IntEnum):
+    """
+    Estados epidemiológicos de mosquitos.
+    
+    OPTIMIZACIÓN: Cada valor es el índice de su compartimento en
+    MosquitoPopulationGrid.compartimentos, de modo que las operaciones por
+    estado indexan el array directamente en lugar de encadenar if/elif.
+    """
+    SUSCEPTIBLE = 0  # S
+    EXPOSED = 1      # E
+    INFECTIOUS = 2   # I
 
 
 class MosquitoPopulationGrid:
@@ -45,6 +58,9 @@ class MosquitoPopulationGrid:
         Mosquitos expuestos por celda (incubando virus)
     I_m : np.ndarray
         Mosquitos infecciosos por celda (pueden transmitir)
+    compartimentos : np.ndarray
+        Array (3 × width × height) que contiene S_m, E_m e I_m; los tres
+        atributos anteriores son vistas de este array
     width : int
         Ancho del grid
     height : int
@@ -71,9 +87,12 @@ class MosquitoPopulationGrid:
         self.height = height
         
         # Arrays numpy para eficiencia (dtype=int32 para poblaciones grandes)
-        self.S_m = np.zeros((width, height), dtype=np.int32)
-        self.E_m = np.zeros((width, height), dtype=np.int32)
-        self.I_m = np.zeros((width, height), dtype=np.int32)
+        # Los tres compartimentos comparten un único bloque de memoria para
+        # poder aplicar operaciones comunes (mortalidad) en una sola llamada
+        self.compartimentos = np.zeros((3, width, height), dtype=np.int32)
+        self.S_m = self.compartimentos[0]
+        self.E_m = self.compartimentos[1]
+        self.I_m = self.compartimentos[2]
         
         # Capacidad de carga por celda (se carga desde configuración)
         # Se inicializa en None y se establece cuando se pasa el modelo
@@ -96,13 +115,28 @@ class MosquitoPopulationGrid:
             return
         
         x, y = pos
+        self.compartimentos[state, x, y] += count
+    
+    def add_mosquitos_batch(self, xs: np.ndarray, ys: np.ndarray, counts: np.ndarray,
+                            state: MosquitoState = MosquitoState.SUSCEPTIBLE):
+        """
+        Agrega mosquitos a varias celdas en una sola operación.
+        
+        Equivale a llamar add_mosquitos para cada celda; las celdas repetidas
+        acumulan sus conteos (np.add.at).
         
-        if state == MosquitoState.SUSCEPTIBLE:
-            self.S_m[x, y] += count
-        elif state == MosquitoState.EXPOSED:
-            self.E_m[x, y] += count
-        elif state == MosquitoState.INFECTIOUS:
-            self.I_m[x, y] += count
+        Parameters
+        ----------
+        xs : np.ndarray
+            Coordenadas x de las celdas
+        ys : np.ndarray
+            Coordenadas y de las celdas
+        counts : np.ndarray
+            Número de mosquitos a agregar en cada celda
+        state : MosquitoState
+            Estado epidemiológico de los mosquitos
+        """
+        np.add.at(self.compartimentos[state], (xs, ys), counts)
     
     def get_total(self, pos: Tuple[int, int]) -> int:
         """
@@ -138,15 +172,7 @@ class MosquitoPopulationGrid:
             Número de mosquitos en ese estado
         """
         x, y = pos
-        
-        if state == MosquitoState.SUSCEPTIBLE:
-            return int(self.S_m[x, y])
-        elif state == MosquitoState.EXPOSED:
-            return int(self.E_m[x, y])
-        elif state == MosquitoState.INFECTIOUS:
-            return int(self.I_m[x, y])
-        
-        return 0
+        return int(self.compartimentos[state, x, y])
     
     def total_mosquitos(self) -> int:
         """
@@ -179,86 +205,59 @@ class MosquitoPopulationGrid:
         2. Transiciones de estado (E → I)
         3. Picaduras y transmisión
         4. Reproducción
+        5. Capacidad de carga
         
-        Parameters
-        ----------
-        model : DengueModel
-            Referencia al modelo principal para acceder a parámetros
-        """
-        # Procesar cada celda del grid
-        for x in range(self.width):
-            for y in range(self.height):
-                self._process_cell(x, y, model)
-    
-    def _process_cell(self, x: int, y: int, model: 'DengueModel'):
-        """
-        Procesa la dinámica de mosquitos en una celda específica.
-        
-        Secuencia de operaciones:
-        1. Mortalidad diaria (binomial por compartimento)
-        2. Transiciones E → I (incubación completada)
-        3. Picaduras y transmisión bidireccional
-        4. Reproducción (hembras que han picado)
+        OPTIMIZACIÓN: El paso se divide en dos fases:
+        - Fase independiente por celda (mortalidad, transiciones,
+          reproducción y capacidad de carga): operaciones vectorizadas de
+          NumPy sobre todo el grid.
+        - Fase de interacciones (picaduras y transmisión): serial, celda por
+          celda, solo en las celdas donde puede haber transmisión.
         
         Parameters
         ----------
-        x : int
-            Coordenada x de la celda
-        y : int
-            Coordenada y de la celda
         model : DengueModel
-            Referencia al modelo principal
+            Referencia al modelo principal para acceder a parámetros
         """
-        # Si no hay mosquitos en esta celda, skip
-        if self.S_m[x, y] == 0 and self.E_m[x, y] == 0 and self.I_m[x, y] == 0:
-            return
-        
         # 1. Mortalidad diaria
-        self._apply_mortality(x, y, model)
+        self._apply_mortality(model)
         
         # 2. Transiciones de estado
-        self._apply_transitions(x, y, model)
+        self._apply_transitions(model)
         
-        # 3. Picaduras y transmisión
-        self._process_biting_and_transmission(x, y, model)
+        # 3. Picaduras y transmisión (orden x, y)
+        candidatas = np.nonzero(self._transmission_mask(model))
+        for x, y in zip(candidatas[0].tolist(), candidatas[1].tolist()):
+            self._process_biting_and_transmission(x, y, model)
         
-        # 4. Reproducción
-        self._process_reproduction(x, y, model)
+        # 4. Reproducción (las picaduras no cambian el total por celda)
+        self._process_reproduction(model)
         
         # 5. Aplicar capacidad de carga (evita crecimiento exponencial)
-        self._apply_carrying_capacity(x, y, model)
+        self._apply_carrying_capacity(model)
     
-    def _apply_mortality(self, x: int, y: int, model: 'DengueModel'):
+    def _apply_mortality(self, model: 'DengueModel'):
         """
-        Aplica mortalidad diaria a mosquitos en una celda.
+        Aplica mortalidad diaria a los mosquitos de todas las celdas.
         
         Usa muestreo binomial para determinar muertes en cada compartimento.
         
+        OPTIMIZACIÓN: Los tres compartimentos se muestrean en un solo sorteo
+        binomial sobre el array compartimentos (una llamada a NumPy por día).
+        
         Parameters
         ----------
-        x, y : int
-            Coordenadas de la celda
         model : DengueModel
             Modelo principal
         """
         mortality_rate = model.mortality_rate
         
         # Mortalidad por compartimento (binomial o aproximación normal)
-        if self.S_m[x, y] > 0:
-            deaths_S = self._safe_binomial(int(self.S_m[x, y]), mortality_rate)
-            self.S_m[x, y] -= deaths_S
-        
-        if self.E_m[x, y] > 0:
-            deaths_E = self._safe_binomial(int(self.E_m[x, y]), mortality_rate)
-            self.E_m[x, y] -= deaths_E
-        
-        if self.I_m[x, y] > 0:
-            deaths_I = self._safe_binomial(int(self.I_m[x, y]), mortality_rate)
-            self.I_m[x, y] -= deaths_I
+        self.compartimentos -= self._safe_binomial_array(self.compartimentos, mortality_rate)
     
-    def _apply_transitions(self, x: int, y: int, model: 'DengueModel'):
+    def _apply_transitions(self, model: 'DengueModel'):
         """
-        Aplica transiciones de estado E → I.
+        Aplica transiciones de estado E → I en todas las celdas.
         
         Mosquitos expuestos se vuelven infecciosos después del período
         de incubación extrínseca (EIP).
@@ -267,24 +266,21 @@ class MosquitoPopulationGrid:
         
         Parameters
         ----------
-        x, y : int
-            Coordenadas de la celda
         model : DengueModel
             Modelo principal
         """
-        if self.E_m[x, y] == 0:
+        if not self.E_m.any():
             return
         
         # Período de incubación extrínseca (días)
-        # Usar parámetro del modelo si existe, sino default 10 días
-        eip = getattr(model, 'mosquito_incubation_period', 10)
+        eip = model.mosquito_incubation_period
         transition_rate = 1.0 / eip
         
         # Mosquitos que completan incubación
-        transitions = self._safe_binomial(int(self.E_m[x, y]), transition_rate)
+        transitions = self._safe_binomial_array(self.E_m, transition_rate)
         
-        self.E_m[x, y] -= transitions
-        self.I_m[x, y] += transitions
+        self.E_m -= transitions
+        self.I_m += transitions
     
     def _safe_binomial(self, n: int, p: float) -> int:
         """
@@ -318,12 +314,89 @@ class MosquitoPopulationGrid:
         # Binomial(n, p) ≈ Normal(μ=np, σ²=np(1-p))
         if n > 1000000:  # 1 millón
             mean = n * p
-            std = np.sqrt(n * p * (1 - p))
+            std = math.sqrt(n * p * (1 - p))
             result = int(np.random.normal(mean, std))
             # Asegurar que está en rango válido
             return max(0, min(n, result))
         else:
-            return np.random.binomial(n, p)
+            # int de Python: la aritmética posterior con escalares de NumPy
+            # es notablemente más lenta
+            return int(np.random.binomial(n, p))
+    
+    def _safe_binomial_array(self, n: np.ndarray, p: float) -> np.ndarray:
+        """
+        Versión vectorizada de _safe_binomial para un array de poblaciones.
+        
+        Parameters
+        ----------
+        n : np.ndarray
+            Número de ensayos por celda
+        p : float
+            Probabilidad de éxito
+            
+        Returns
+        -------
+        np.ndarray
+            Número de éxitos por celda (mismo dtype y forma que n)
+        """
+        if p <= 0:
+            return np.zeros_like(n)
+        
+        if p >= 1:
+            return n.copy()
+        
+        result = np.random.binomial(n, p).astype(n.dtype)
+        
+        # Para n muy grande, usar aproximación normal
+        # Binomial(n, p) ≈ Normal(μ=np, σ²=np(1-p))
+        grandes = n > 1000000  # 1 millón
+        if grandes.any():
+            n_grandes = n[grandes]
+            mean = n_grandes * p
+            std = np.sqrt(n_grandes * p * (1 - p))
+            aproximado = np.random.normal(mean, std).astype(np.int64)
+            # Asegurar que está en rango válido
+            result[grandes] = np.clip(aproximado, 0, n_grandes)
+        
+        return result
+    
+    def _transmission_mask(self, model: 'DengueModel') -> np.ndarray:
+        """
+        Calcula las celdas donde puede ocurrir transmisión en este paso.
+        
+        Una celda necesita procesar picaduras solo si:
+        - Tiene mosquitos infecciosos (posible transmisión M → H), o
+        - Tiene mosquitos susceptibles y algún humano infeccioso dentro
+          del radio sensorial (posible transmisión H → M)
+        
+        En cualquier otra celda _process_biting_and_transmission termina
+        sin realizar sorteos, por lo que omitirla no altera la simulación.
+        
+        Parameters
+        ----------
+        model : DengueModel
+            Modelo principal
+            
+        Returns
+        -------
+        np.ndarray
+            Máscara booleana (width × height) de celdas a procesar
+        """
+        mask = self.I_m > 0
+        
+        if not self.S_m.any():
+            return mask
+        
+        # Marcar el vecindario Moore de cada celda con humanos infecciosos
+        # (el índice mantiene el conteo por celda, así que solo se recorren
+        # las celdas que tienen alguno)
+        radio = model.sensory_range
+        cerca_infeccioso = np.zeros((self.width, self.height), dtype=bool)
+        for hx, hy in model.indice_humanos.infecciosos:
+            cerca_infeccioso[max(0, hx - radio):hx + radio + 1,
+                             max(0, hy - radio):hy + radio + 1] = True
+        
+        return mask | ((self.S_m > 0) & cerca_infeccioso)
     
     def _process_biting_and_transmission(self, x: int, y: int, model: 'DengueModel'):
         """
@@ -344,42 +417,46 @@ class MosquitoPopulationGrid:
         model : DengueModel
             Modelo principal
         """
-        # Obtener humanos en vecindario Moore (radio = sensory_range)
-        # Esto emula que los mosquitos vuelan para buscar humanos
-        radius = model.sensory_range
-        
-        # Obtener vecinos en radio (incluye celda central)
-        neighbors = model.grid.get_neighborhood(
-            (x, y),
-            moore=True,
-            include_center=True,
-            radius=radius
-        )
-        
-        # Obtener todos los humanos en el vecindario
-        humanos = []
-        for neighbor_pos in neighbors:
-            agents_in_cell = model.grid.get_cell_list_contents([neighbor_pos])
-            from ..agents.human_agent import HumanAgent
-            humanos.extend([a for a in agents_in_cell if isinstance(a, HumanAgent)])
+        # Obtener humanos en vecindario Moore (radio = sensory_range, incluye
+        # la celda central). Esto emula que los mosquitos vuelan para buscar
+        # humanos. Usa el índice espacial de humanos del modelo en lugar de
+        # recorrer celda por celda el MultiGrid.
+        humanos = model.obtener_humanos_cercanos((x, y), model.sensory_range)
         
         if not humanos:
             return
         
+        # Separar susceptibles e infecciosos en una sola pasada sobre el
+        # vecindario (cada dirección de transmisión usa una de las listas).
+        # Las exposiciones del paso 1 (S → E) no crean infecciosos, por lo
+        # que la lista de infecciosos sigue siendo válida en el paso 2.
+        susceptibles = []
+        infecciosos = []
+        for humano in humanos:
+            estado = humano.estado
+            if estado is _SUSCEPTIBLE:
+                susceptibles.append(humano)
+            elif estado is _INFECTADO:
+                infecciosos.append(humano)
+        
         # Parámetros de transmisión
         alpha = model.mosquito_to_human_prob  # α
         beta = model.human_to_mosquito_prob   # β
+        bite_rate = model.bite_rate
+        H_tot = len(humanos)
         
         # 1. Transmisión Mosquito → Humano
         if self.I_m[x, y] > 0:
-            self._mosquito_to_human_transmission(x, y, humanos, alpha, model)
+            self._mosquito_to_human_transmission(x, y, susceptibles, H_tot, alpha, bite_rate, model)
         
         # 2. Transmisión Humano → Mosquito
         if self.S_m[x, y] > 0:
-            self._human_to_mosquito_transmission(x, y, humanos, beta, model)
+            self._human_to_mosquito_transmission(x, y, infecciosos, H_tot, beta, bite_rate)
     
-    def _mosquito_to_human_transmission(self, x: int, y: int, humanos: List, 
-                                       alpha: float, model: 'DengueModel'):
+    def _mosquito_to_human_transmission(self, x: int, y: int,
+                                       susceptible_humans: List, H_tot: int,
+                                       alpha: float, bite_rate: float,
+                                       model: 'DengueModel'):
         """
         Transmisión de mosquitos infecciosos a humanos susceptibles.
         
@@ -392,10 +469,14 @@ class MosquitoPopulationGrid:
         ----------
         x, y : int
             Coordenadas de la celda
-        humanos : List
-            Lista de agentes humanos en el vecindario
+        susceptible_humans : List
+            Humanos susceptibles en el vecindario
+        H_tot : int
+            Número total de humanos en el vecindario
         alpha : float
             Probabilidad de transmisión mosquito→humano (α) dado que picó
+        bite_rate : float
+            Probabilidad diaria de picadura de cada mosquito
         model : DengueModel
             Modelo principal
         """
@@ -403,15 +484,12 @@ class MosquitoPopulationGrid:
         if I <= 0:
             return
 
-        susceptible_humans = [h for h in humanos if h.es_susceptible()]
         H_s = len(susceptible_humans)
-        H_tot = len(humanos)
 
         if H_s == 0 or H_tot == 0:
             return
 
         # 1. Mosquitos infecciosos que pican hoy
-        bite_rate = getattr(model, "bite_rate", 0.33)
         biting_I = self._safe_binomial(I, bite_rate)
         if biting_I == 0:
             return
@@ -434,8 +512,9 @@ class MosquitoPopulationGrid:
         for human in model.random.sample(susceptible_humans, new_infections):
             human.get_exposed()
     
-    def _human_to_mosquito_transmission(self, x: int, y: int, humanos: List,
-                                       beta: float, model: 'DengueModel'):
+    def _human_to_mosquito_transmission(self, x: int, y: int,
+                                       infectious_humans: List, H_tot: int,
+                                       beta: float, bite_rate: float):
         """
         Transmisión de humanos infecciosos a mosquitos susceptibles.
         
@@ -448,26 +527,25 @@ class MosquitoPopulationGrid:
         ----------
         x, y : int
             Coordenadas de la celda
-        humanos : List
-            Lista de agentes humanos en el vecindario
+        infectious_humans : List
+            Humanos infecciosos en el vecindario
+        H_tot : int
+            Número total de humanos en el vecindario
         beta : float
             Probabilidad de transmisión humano→mosquito (β) dado que picó
-        model : DengueModel
-            Modelo principal
+        bite_rate : float
+            Probabilidad diaria de picadura de cada mosquito
         """
         S = int(self.S_m[x, y])
         if S <= 0:
             return
 
-        infectious_humans = [h for h in humanos if h.es_infeccioso()]
         H_i = len(infectious_humans)
-        H_tot = len(humanos)
 
         if H_tot == 0 or H_i == 0:
             return
 
         # 1. Mosquitos susceptibles que pican hoy
-        bite_rate = getattr(model, "bite_rate", 0.33)
         biting_S = self._safe_binomial(S, bite_rate)
         if biting_S == 0:
             return
@@ -488,77 +566,66 @@ class MosquitoPopulationGrid:
         self.S_m[x, y] -= new_E
         self.E_m[x, y] += new_E
     
-    def _process_reproduction(self, x: int, y: int, model: 'DengueModel'):
+    def _process_reproduction(self, model: 'DengueModel'):
         """
-        Procesa reproducción de mosquitos en una celda.
+        Procesa reproducción de mosquitos en todas las celdas.
         
         Solo hembras que han picado pueden reproducirse.
-        Los huevos se agregan al EggManager.
+        Los huevos se agregan al EggManager en un solo lote por día.
         
         Parameters
         ----------
-        x, y : int
-            Coordenadas de la celda
         model : DengueModel
             Modelo principal
         """
-        total_mosquitos = self.S_m[x, y] + self.E_m[x, y] + self.I_m[x, y]
-        
-        if total_mosquitos == 0:
-            return
+        total_mosquitos = self.S_m + self.E_m + self.I_m
         
         # Parámetros de reproducción
         female_ratio = model.female_ratio
         eggs_per_female = model.eggs_per_female
         gonotrophic_cycle = model.gonotrophic_cycle_days
         
-        # Hembras en la celda
-        females = int(total_mosquitos * female_ratio)
-        
-        if females == 0:
-            return
+        # Hembras por celda
+        females = (total_mosquitos * female_ratio).astype(np.int64)
         
         # Hembras que se reproducen (ciclo gonotrófico)
         # Probabilidad diaria = 1 / gonotrophic_cycle_days
         reproduction_prob = 1.0 / gonotrophic_cycle
-        reproducing_females = self._safe_binomial(int(females), reproduction_prob)
-        
-        if reproducing_females == 0:
-            return
+        reproducing_females = self._safe_binomial_array(females, reproduction_prob)
         
-        # Huevos puestos (agregar a EggManager)
+        # Huevos puestos por celda
         eggs = reproducing_females * eggs_per_female
         
-        if eggs > 0:
-            # Agregar huevos al sitio de cría más cercano
-            # (simplificación: usar la celda actual como sitio)
-            model.egg_manager.add_eggs((x, y), eggs)
+        # Agregar huevos en la celda donde se pusieron (simplificación: usar
+        # la celda actual como sitio), todas las celdas en una sola llamada
+        xs, ys = np.nonzero(eggs > 0)
+        if len(xs) > 0:
+            model.egg_manager.add_eggs_batch(xs, ys, eggs[xs, ys])
     
-    def _apply_carrying_capacity(self, x: int, y: int, model: 'DengueModel'):
+    def _apply_carrying_capacity(self, model: 'DengueModel'):
         """
-        Aplica capacidad de carga a una celda.
+        Aplica capacidad de carga a todas las celdas.
         
-        Si la población excede la capacidad, reduce proporcionalmente
-        todos los compartimentos.
+        En las celdas donde la población excede la capacidad, reduce
+        proporcionalmente todos los compartimentos.
         
         Parameters
         ----------
-        x, y : int
-            Coordenadas de la celda
         model : DengueModel
             Modelo principal (para obtener carrying_capacity_per_cell)
         """
-        total = self.S_m[x, y] + self.E_m[x, y] + self.I_m[x, y]
+        total = self.S_m + self.E_m + self.I_m
         
         # Obtener capacidad de carga desde modelo
-        capacity = getattr(model, 'carrying_capacity_per_cell', 3000)
-        
-        if total > capacity:
-            # Reducir proporcionalmente
-            factor = capacity / total
-            self.S_m[x, y] = int(self.S_m[x, y] * factor)
-            self.E_m[x, y] = int(self.E_m[x, y] * factor)
-            self.I_m[x, y] = int(self.I_m[x, y] * factor)
+        capacity = model.carrying_capacity_per_cell
+        
+        excedidas = total > capacity
+        if not excedidas.any():
+            return
+        
+        # Reducir proporcionalmente
+        factor = capacity / total[excedidas]
+        self.compartimentos[:, excedidas] = (self.compartimentos[:, excedidas] * factor).astype(np.int32)
     
     def __repr__(self) -> str:
         """Representación en cadena del grid"""
@@ -2,12 +2,14 @@
 Utilidades para la simulación ABM-Dengue.
 
 Este módulo contiene funciones auxiliares para manejo de datos,
-visualización, configuración y procesamiento de información climática.
+visualización, configuración, procesamiento de información climática y
+vecindarios precalculados del grid.
 """
 
 __version__ = "0.1.0"
 __all__ = [
     "climate_data",
+    "vecindad",
     "epidemiology_data",
     "visualization",
     "config_loader"
@@ -9,8 +9,8 @@ Universidad Industrial de Santander - Simulación Digital F1
 """
 
 import pandas as pd
-from datetime import datetime
-from typing import Tuple, Optional
+from datetime import date as Fecha, datetime
+from typing import Dict, Tuple, Optional
 import os
 
 
@@ -30,6 +30,12 @@ class ClimateDataLoader:
     ----------
     data : pd.DataFrame
         DataFrame con los datos climáticos cargados
+    
+    Notes
+    -----
+    OPTIMIZACIÓN: Al cargar el archivo se construye además un diccionario
+    {fecha: (tavg, prcp)}; get_climate_data y has_date lo consultan en lugar
+    de hacer data.loc[Timestamp] (una búsqueda de pandas por día simulado).
     """
     
     def __init__(self, csv_path: str):
@@ -80,6 +86,12 @@ class ClimateDataLoader:
         # Para prcp: rellenar con 0 (asumir sin lluvia)
         if self.data['prcp'].isnull().any():
             self.data['prcp'] = self.data['prcp'].fillna(0.0)
+        
+        # Tabla de consulta por fecha (datos ya limpios)
+        self._por_fecha: Dict[Fecha, Tuple[float, float]] = dict(zip(
+            self.data.index.date,
+            zip(self.data['tavg'].tolist(), self.data['prcp'].tolist())
+        ))
     
     def get_climate_data(self, date: datetime) -> Tuple[float, float]:
         """
@@ -101,13 +113,8 @@ class ClimateDataLoader:
             Si la fecha no está en los datos disponibles
         """
         # Normalizar la fecha (sin hora)
-        date_normalized = pd.Timestamp(date.date())
-        
         try:
-            row = self.data.loc[date_normalized]
-            temp = float(row['tavg'])
-            precip = float(row['prcp'])
-            return temp, precip
+            return self._por_fecha[date.date()]
         except KeyError:
             raise KeyError(
                 f"No hay datos climáticos disponibles para la fecha {date.date()}. "
@@ -139,5 +146,4 @@ class ClimateDataLoader:
         bool
             True si hay datos para la fecha, False en caso contrario
         """
-        date_normalized = pd.Timestamp(date.date())
-        return date_normalized in self.data.index
+        return date.date() in self._por_fecha
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Vecindarios Moore precalculados para el modelo ABM del Dengue.
+
+Los agentes humanos y mosquitos se desplazan sorteando un desplazamiento
+dentro de un vecindario Moore. Este módulo calcula esos desplazamientos
+una sola vez por radio para que ninguno de los agentes tenga que construir
+el vecindario con grid.get_neighborhood en cada movimiento.
+
+Autor: Yeison Adrián Cáceres Torres, William Urrutia Torres, Jhon Anderson Vargas Gómez
+Universidad Industrial de Santander - Simulación Digital F1
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=None)
+def offsets_moore(radio: int, incluir_centro: bool = False) -> Tuple[Tuple[int, int], ...]:
+    """
+    Desplazamientos del vecindario Moore de radio dado.
+    
+    Se calculan una sola vez por radio y se reutilizan en cada movimiento.
+    
+    Parameters
+    ----------
+    radio : int
+        Radio del vecindario en celdas
+    incluir_centro : bool
+        Si se incluye el desplazamiento nulo (0, 0)
+        
+    Returns
+    -------
+    Tuple[Tuple[int, int], ...]
+        Desplazamientos (dx, dy) en el mismo orden que get_neighborhood
+    """
+    return tuple(
+        (dx, dy)
+        for dx in range(-radio, radio + 1)
+        for dy in range(-radio, radio + 1)
+        if incluir_centro or dx != 0 or dy != 0
+    )
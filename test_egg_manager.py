@@ -5,12 +5,16 @@ Prueba básica sin dependencias externas pesadas.
 """
 
 import sys
+from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
+
 # Agregar src al path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.model.egg_manager import EggManager, EggBatch
+from src.agents.mosquito_agent import MosquitoAgent, ParametrosMosquito, EtapaVida
 
 
 class MockModel:
@@ -19,33 +23,50 @@ class MockModel:
         self.dia_simulacion = 0
         self.temperatura_actual = 25.0
         self.immature_development_threshold = 8.3
+        self.grados_dia_actual = self.temperatura_actual - self.immature_development_threshold
         self.immature_thermal_constant = 181.2
         self.grid = MockGrid()
-        self.agents = MockAgentSet()
+        # Registro de agentes igual al de mesa.Model (Agent.__init__ escribe aquí)
+        self.agents_ = defaultdict(dict)
         self._next_id = 0
         
+        # Parámetros de mosquito que lee ParametrosMosquito.desde_modelo
+        # (valores de la configuración por defecto del modelo)
+        self.gonotrophic_cycle_days = 3
+        self.mortality_rate = 0.05
+        self.sensory_range = 3
+        self.mating_probability = 0.6
+        self.eggs_per_female = 100
+        self.mosquito_to_human_prob = 0.6
+        self.human_to_mosquito_prob = 0.275
+        self.rainfall_threshold = 0.0
+        self.female_ratio = 0.5
+        self.max_range = 5
+        self.parametros_mosquito = ParametrosMosquito.desde_modelo(self)
+        
         class MockRandom:
             def random(self):
                 return 0.5
         
         self.random = MockRandom()
+        self.rng_np = np.random.default_rng(0)
     
     def next_id(self):
         self._next_id += 1
         return self._next_id
+    
+    def next_id_range(self, n):
+        base = self._next_id + 1
+        self._next_id += n
+        return range(base, base + n)
 
 
 class MockGrid:
-    def place_agent(self, agent, pos):
-        pass
-
-
-class MockAgentSet:
-    def __init__(self):
-        self.agents = []
+    width = 50
+    height = 50
     
-    def add(self, agent):
-        self.agents.append(agent)
+    def place_agent(self, agent, pos):
+        agent.pos = pos
 
 
 def test_egg_batch_creation():
@@ -72,20 +93,29 @@ def test_egg_manager_add_eggs():
     # Agregar primer lote
     manager.add_eggs((5, 5), 100)
     assert manager.count_eggs() == 100
-    assert len(manager.egg_batches) == 1
+    assert manager.num_batches == 1
     print(f"✓ Primer lote agregado: {manager.count_eggs()} huevos")
     
     # Agregar segundo lote en mismo sitio y mismo día (debe agruparse)
     manager.add_eggs((5, 5), 50)
     assert manager.count_eggs() == 150
-    assert len(manager.egg_batches) == 1  # Agrupados en un solo lote
-    print(f"✓ Segundo lote agrupado: {manager.count_eggs()} huevos, {len(manager.egg_batches)} lote(s)")
+    assert manager.num_batches == 1  # Agrupados en un solo lote
+    print(f"✓ Segundo lote agrupado: {manager.count_eggs()} huevos, {manager.num_batches} lote(s)")
     
     # Agregar lote en diferente sitio
     manager.add_eggs((10, 10), 75)
     assert manager.count_eggs() == 225
-    assert len(manager.egg_batches) == 2
-    print(f"✓ Tercer lote en sitio diferente: {manager.count_eggs()} huevos, {len(manager.egg_batches)} lote(s)")
+    assert manager.num_batches == 2
+    print(f"✓ Tercer lote en sitio diferente: {manager.count_eggs()} huevos, {manager.num_batches} lote(s)")
+    
+    # egg_batches devuelve copias en una tupla: no admite agregar lotes
+    assert len(manager) == len(manager.egg_batches) == 2
+    try:
+        manager.egg_batches.append(EggBatch(sitio_cria=(1, 1), cantidad=10))
+        assert False, "egg_batches debería ser de solo lectura"
+    except AttributeError:
+        pass
+    print("✓ egg_batches es de solo lectura")
 
 
 def test_egg_development():
@@ -118,8 +148,13 @@ def test_egg_development():
     
     # Verificar que eclosionaron (huevos = 0, adultos creados)
     assert manager.count_eggs() == 0
-    assert len(model.agents.agents) == 10
-    print(f"✓ Día 11: Eclosionaron! {len(model.agents.agents)} mosquitos adultos creados")
+    mosquitos = list(model.agents_[MosquitoAgent])
+    assert len(mosquitos) == 10
+    assert all(m.etapa == EtapaVida.ADULTO and m.pos == (5, 5) for m in mosquitos)
+    assert all(m.params is model.parametros_mosquito for m in mosquitos)
+    # IDs reservados en bloque con next_id_range
+    assert sorted(m.unique_id for m in mosquitos) == list(range(1, 11))
+    print(f"✓ Día 11: Eclosionaron! {len(mosquitos)} mosquitos adultos creados")
 
 
 def test_lsm_control():
@@ -166,6 +201,57 @@ def test_mortality():
     print("✓ Mortalidad aplicada correctamente")
 
 
+def test_add_eggs_batch():
+    """Test 6: Inserción en bloque equivalente a add_eggs"""
+    print("\nTest 6: Inserción en bloque de huevos...")
+    model = MockModel()
+    individual = EggManager(model)
+    bloque = EggManager(model)
+    
+    xs, ys, cantidades = [5, 1, 5, 7], [5, 2, 5, 0], [100, 30, 50, 0]
+    
+    individual.add_eggs((1, 2), 10)
+    bloque.add_eggs((1, 2), 10)
+    for x, y, c in zip(xs, ys, cantidades):
+        individual.add_eggs((x, y), c)
+    bloque.add_eggs_batch(xs, ys, cantidades)
+    
+    assert bloque.egg_batches == individual.egg_batches
+    assert bloque.get_eggs_by_site((5, 5)) == 150
+    assert bloque.get_eggs_by_site((1, 2)) == 40
+    print(f"✓ Lotes equivalentes: {bloque.num_batches}")
+
+
+def test_mortality_uses_model_rng():
+    """Test 7: La mortalidad usa el generador del modelo, no np.random"""
+    print("\nTest 7: Mortalidad reproducible con el generador del modelo...")
+    resultados = []
+    for _ in range(2):
+        model = MockModel()
+        manager = EggManager(model)
+        for i in range(50):
+            manager.add_eggs((i, 0), 37)
+        # Consumir el estado global no debe alterar el resultado
+        np.random.random(100)
+        manager.apply_mortality(mortality_rate=0.1)
+        resultados.append([b.cantidad for b in manager.egg_batches])
+    
+    assert resultados[0] == resultados[1]
+    print("✓ Mortalidad reproducible con model.rng_np")
+
+
+def test_large_grid_coordinates():
+    """Test 8: Coordenadas fuera del rango de int16 no se desbordan"""
+    print("\nTest 8: Grilla mayor que el rango de int16...")
+    model = MockModel()
+    model.grid.width = 40000
+    manager = EggManager(model)
+    manager.add_eggs((39999, 7), 10)
+    
+    assert manager.egg_batches[0].sitio_cria == (39999, 7)
+    print("✓ Coordenadas preservadas con columnas int32")
+
+
 def main():
     print("="*60)
     print("PRUEBAS DE EggManager")
@@ -177,6 +263,9 @@ def main():
         test_egg_development()
         test_lsm_control()
         test_mortality()
+        test_add_eggs_batch()
+        test_mortality_uses_model_rng()
+        test_large_grid_coordinates()
         
         print("\n" + "="*60)
         print("✓ TODAS LAS PRUEBAS PASARON")
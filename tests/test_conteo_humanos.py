@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Pruebas del conteo incremental de humanos por estado SEIR.
+
+Verifica que DengueModel.conteo_humanos (actualizado en cada transición)
+coincida con un recuento directo sobre los agentes humanos.
+"""
+
+import contextlib
+import io
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Agregar directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.agents import HumanAgent, EstadoSalud
+from src.model.dengue_model import DengueModel
+
+
+def _conteo_bruto(model):
+    """Recuento de referencia recorriendo todos los agentes."""
+    conteo = {estado: 0 for estado in EstadoSalud}
+    for agente in model.agents:
+        if isinstance(agente, HumanAgent):
+            conteo[agente.estado] += 1
+    return conteo
+
+
+def test_conteo_coincide_con_recuento():
+    """El conteo se mantiene consistente a lo largo de la simulación."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        model = DengueModel(
+            width=30,
+            height=30,
+            num_humanos=200,
+            num_mosquitos=300,
+            num_huevos=10,
+            seed=11,
+            fecha_inicio=datetime(2022, 1, 1),
+            climate_data_path=str(root_dir / 'data' / 'raw' / 'datos_climaticos_2022.csv')
+        )
+        assert model.conteo_humanos == _conteo_bruto(model)
+        assert sum(model.conteo_humanos.values()) == 200
+
+        for _ in range(15):
+            model.step()
+            assert model.conteo_humanos == _conteo_bruto(model)
+
+    for estado in EstadoSalud:
+        assert model._contar_humanos_estado(estado) == model.conteo_humanos[estado]
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Pruebas del índice espacial de humanos.
+
+Verifica que IndiceEspacialHumanos devuelva los mismos humanos que el
+vecindario Moore del MultiGrid de Mesa y que se mantenga consistente
+cuando los humanos se mueven entre sectores.
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.model.indice_espacial import IndiceEspacialHumanos
+
+
+class HumanoMock:
+    """Humano mínimo: el índice solo necesita pos y es_infeccioso()."""
+    def __init__(self, pos, infeccioso=False):
+        self.pos = pos
+        self.infeccioso = infeccioso
+
+    def es_infeccioso(self):
+        return self.infeccioso
+
+
+def _vecindario_bruto(humanos, pos, radio, incluir_centro=True):
+    """Referencia por fuerza bruta (distancia de Chebyshev)."""
+    x, y = pos
+    return {
+        h for h in humanos
+        if max(abs(h.pos[0] - x), abs(h.pos[1] - y)) <= radio
+        and (incluir_centro or h.pos != pos)
+    }
+
+
+def test_consulta_equivale_a_fuerza_bruta():
+    """La consulta coincide con la búsqueda exhaustiva en todo el grid."""
+    indice = IndiceEspacialHumanos(tamano_sector=3)
+    humanos = [HumanoMock(((i * 7) % 20, (i * 11) % 20)) for i in range(60)]
+    for h in humanos:
+        indice.agregar(h, h.pos)
+
+    for pos in [(0, 0), (5, 5), (10, 3), (19, 19), (2, 17)]:
+        for radio in (1, 3, 5):
+            for incluir_centro in (True, False):
+                esperado = _vecindario_bruto(humanos, pos, radio, incluir_centro)
+                obtenido = indice.consultar(pos, radio, incluir_centro)
+                assert set(obtenido) == esperado
+                assert len(obtenido) == len(esperado)
+
+
+def test_mover_entre_sectores():
+    """Mover un humano actualiza el sector en el que se encuentra."""
+    indice = IndiceEspacialHumanos(tamano_sector=3)
+    humano = HumanoMock((0, 0))
+    indice.agregar(humano, humano.pos)
+
+    # Movimiento dentro del mismo sector
+    humano.pos = (1, 2)
+    indice.mover(humano, (0, 0), (1, 2))
+    assert indice.consultar((1, 2), 0) == [humano]
+    assert indice.en_celda((1, 2)) == [humano]
+    assert indice.en_celda((0, 0)) == []
+
+    # Movimiento a otro sector
+    humano.pos = (10, 10)
+    indice.mover(humano, (1, 2), (10, 10))
+    assert indice.consultar((1, 2), 3) == []
+    assert indice.consultar((9, 9), 1) == [humano]
+    assert len(indice) == 1
+
+    assert indice.en_celda((10, 10)) == [humano]
+
+    indice.remover(humano, humano.pos)
+    assert len(indice) == 0
+    assert indice.en_celda((10, 10)) == []
+
+
+def test_conteo_infecciosos_por_celda():
+    """El contador de infecciosos sigue a movimientos y cambios de estado."""
+    indice = IndiceEspacialHumanos(tamano_sector=3)
+    sano = HumanoMock((2, 2))
+    enfermo = HumanoMock((2, 2), infeccioso=True)
+    indice.agregar(sano, sano.pos)
+    indice.agregar(enfermo, enfermo.pos)
+    assert indice.infecciosos == {(2, 2): 1}
+
+    # Mover al infeccioso traslada su conteo; mover al sano no lo altera
+    enfermo.pos = (8, 1)
+    indice.mover(enfermo, (2, 2), (8, 1))
+    sano.pos = (8, 1)
+    indice.mover(sano, (2, 2), (8, 1))
+    assert indice.infecciosos == {(8, 1): 1}
+
+    # Cambios de estado en la posición actual
+    sano.infeccioso = True
+    indice.actualizar_infeccioso(sano, True)
+    assert indice.infecciosos == {(8, 1): 2}
+    enfermo.infeccioso = False
+    indice.actualizar_infeccioso(enfermo, False)
+    indice.remover(sano, sano.pos)
+    assert indice.infecciosos == {}
+
+
+def test_indice_coincide_con_grid_del_modelo():
+    """En un modelo real, el índice devuelve los mismos humanos que Mesa."""
+    import contextlib
+    import io
+    from datetime import datetime
+
+    from src.agents import HumanAgent
+    from src.model.dengue_model import DengueModel
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        model = DengueModel(
+            width=30,
+            height=30,
+            num_humanos=200,
+            num_mosquitos=50,
+            num_huevos=10,
+            seed=7,
+            fecha_inicio=datetime(2022, 1, 1),
+            climate_data_path=str(root_dir / 'data' / 'raw' / 'datos_climaticos_2022.csv')
+        )
+        # Mover a los humanos algunos días
+        for _ in range(3):
+            model.step()
+
+    radio = model.sensory_range
+    for x in range(0, model.width, 4):
+        for y in range(0, model.height, 4):
+            vecinos = model.grid.get_neighbors((x, y), moore=True, include_center=True, radius=radio)
+            esperado = {a for a in vecinos if isinstance(a, HumanAgent)}
+            assert set(model.obtener_humanos_cercanos((x, y), radio)) == esperado
+
+            en_celda = {a for a in model.grid.get_cell_list_contents([(x, y)]) if isinstance(a, HumanAgent)}
+            assert set(model.indice_humanos.en_celda((x, y))) == en_celda
+
+    # El conteo de infecciosos por celda coincide con el estado real
+    esperado = {}
+    for h in model.agents:
+        if isinstance(h, HumanAgent) and h.es_infeccioso():
+            esperado[h.pos] = esperado.get(h.pos, 0) + 1
+    assert model.indice_humanos.infecciosos == esperado
+
+
+def test_indice_temporales_sin_sectores_vacios():
+    """Al secarse los charcos se eliminan sus sectores del índice temporal."""
+    import contextlib
+    import io
+    from datetime import datetime
+
+    from src.model.dengue_model import DengueModel
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        model = DengueModel(
+            width=30,
+            height=30,
+            num_humanos=20,
+            num_mosquitos=10,
+            num_huevos=0,
+            seed=5,
+            fecha_inicio=datetime(2022, 1, 1),
+            climate_data_path=str(root_dir / 'data' / 'raw' / 'datos_climaticos_2022.csv')
+        )
+
+    # Forzar una lluvia que crea charcos y luego días secos hasta que desaparecen
+    model.precipitacion_actual = model.temp_site_min_rainfall + 10
+    model._actualizar_sitios_cria_temporales()
+    assert model.sitios_cria_temporales
+    assert all(model.indice_sitios_temporales.values())
+
+    model.precipitacion_actual = 0.0
+    for _ in range(model.temp_site_duration_days):
+        model._actualizar_sitios_cria_temporales()
+        assert all(model.indice_sitios_temporales.values())
+
+    assert model.sitios_cria_temporales == {}
+    assert model.indice_sitios_temporales == {}